@@ -1,11 +1,11 @@
 from .neon_client import NeonClient, NeonEndpoint, NeonError
-from .gaze_stream import GazeSample, GazeStream
+from .gaze_stream import GazeBatch, GazeRing, GazeSample, GazeStream
 from .marker_bridge import ETMarkerBridge
 from .sync import NeonTimeSync
 from .storage import ETStorage
 
 __all__ = [
     "NeonClient", "NeonEndpoint", "NeonError",
-    "GazeSample", "GazeStream",
+    "GazeSample", "GazeStream", "GazeRing", "GazeBatch",
     "ETMarkerBridge", "NeonTimeSync", "ETStorage",
 ]
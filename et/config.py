@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 
@@ -12,15 +13,15 @@ class ETConfig:
     p2: NeonEndpoint | None
 
 
+@functools.lru_cache(maxsize=1)
 def load_from_env() -> ETConfig:
+    """Liest NEON_P1/NEON_P2 einmalig; Env-Variablen ändern sich zur Laufzeit nicht."""
     def parse(name: str) -> NeonEndpoint | None:
         val = os.getenv(name, "")
         if not val:
             return None
-        if ":" in val:
-            host, port = val.split(":", 1)
-            return NeonEndpoint(host.strip(), int(port))
-        return NeonEndpoint(val.strip(), 8080)
+        host, sep, port = val.partition(":")
+        return NeonEndpoint(host.strip(), int(port) if sep else 8080)
 
     return ETConfig(parse("NEON_P1"), parse("NEON_P2"))
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
-import asyncio, time
+import asyncio, math, time
 from dataclasses import dataclass
-from typing import Callable, Optional
-from .neon_ws import NeonWSConfig, neon_gaze_stream
+from typing import Callable, Iterator, Optional, Sequence
+import numpy as np
+from .neon_ws import NeonWSConfig, neon_gaze_field_batches
 from .neon_client import NeonEndpoint
 
 @dataclass(slots=True)
@@ -14,11 +15,131 @@ class GazeSample:
     t_device_ns: int
     t_host_ns: int
 
+class GazeBatch(Sequence[GazeSample]):
+    """
+    Sicht auf einen zusammenhängenden Abschnitt eines GazeRing.
+    Gültig, bis der Ring überschrieben wird (``capacity`` weitere Samples).
+    """
+    __slots__ = ("ring", "start", "end")
+
+    def __init__(self, ring: "GazeRing", start: int, end: int) -> None:
+        self.ring = ring
+        self.start = start
+        self.end = end
+
+    @property
+    def player(self) -> str:
+        return self.ring.player
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, i: int) -> GazeSample:  # type: ignore[override]
+        n = self.end - self.start
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        return self.ring[self.start + i]
+
+    def __iter__(self) -> Iterator[GazeSample]:
+        ring = self.ring
+        for i in range(self.start, self.end):
+            yield ring[i]
+
+    def columns(self) -> tuple[list[float], list[float], list[float | None], list[int], list[int]]:
+        """(x, y, conf, t_device_ns, t_host_ns) als Python-Listen, je eine Konvertierung pro Spalte."""
+        r, a, b = self.ring, self.start, self.end
+        conf = r.conf[a:b].tolist()
+        if r.has_nan_conf(a, b):
+            conf = [None if c != c else c for c in conf]
+        return r.x[a:b].tolist(), r.y[a:b].tolist(), conf, r.t_device_ns[a:b].tolist(), r.t_host_ns[a:b].tolist()
+
+class GazeRing:
+    """
+    Vorallokierter Ringpuffer (SoA) für Gaze-Samples eines Spielers.
+    Keine Python-Objekte pro Sample; fehlende Confidence wird als NaN gespeichert.
+    """
+    __slots__ = ("player", "capacity", "x", "y", "conf", "t_device_ns", "t_host_ns", "_start", "_head")
+
+    def __init__(self, player: str, capacity: int = 4096) -> None:
+        self.player = player
+        self.capacity = capacity
+        self.x = np.empty(capacity, dtype=np.float64)
+        self.y = np.empty(capacity, dtype=np.float64)
+        self.conf = np.empty(capacity, dtype=np.float64)
+        self.t_device_ns = np.empty(capacity, dtype=np.int64)
+        self.t_host_ns = np.empty(capacity, dtype=np.int64)
+        self._start = 0
+        self._head = 0
+
+    def append(self, x: float, y: float, conf: float | None, t_device_ns: int, t_host_ns: int) -> int:
+        """Schreibt ein Sample und liefert die Anzahl noch nicht abgeholter Samples."""
+        i = self._head
+        self.x[i] = x
+        self.y[i] = y
+        self.conf[i] = math.nan if conf is None else conf
+        self.t_device_ns[i] = t_device_ns
+        self.t_host_ns[i] = t_host_ns
+        self._head = i + 1
+        return self._head - self._start
+
+    @property
+    def pending(self) -> int:
+        return self._head - self._start
+
+    @property
+    def full(self) -> bool:
+        return self._head >= self.capacity
+
+    def has_nan_conf(self, start: int, end: int) -> bool:
+        return bool(np.isnan(self.conf[start:end]).any())
+
+    def take(self) -> GazeBatch:
+        """Liefert alle noch nicht abgeholten Samples; am Ende des Puffers wird umgebrochen."""
+        batch = GazeBatch(self, self._start, self._head)
+        if self._head >= self.capacity:
+            self._head = 0
+        self._start = self._head
+        return batch
+
+    def __getitem__(self, i: int) -> GazeSample:
+        c = float(self.conf[i])
+        return GazeSample(
+            self.player,
+            float(self.x[i]),
+            float(self.y[i]),
+            None if c != c else c,
+            int(self.t_device_ns[i]),
+            int(self.t_host_ns[i]),
+        )
+
 class GazeStream:
-    def __init__(self, player: str, endpoint: NeonEndpoint, on_sample: Callable[[GazeSample], None]) -> None:
+    # Für die Ziel-Sampleraten (200 Hz pro Spieler) wird uvloop empfohlen;
+    # tabletop.app installiert es automatisch, falls vorhanden.
+    def __init__(
+        self,
+        player: str,
+        endpoint: NeonEndpoint,
+        on_sample: Optional[Callable[[GazeSample], None]] = None,
+        *,
+        on_batch: Optional[Callable[[GazeBatch], None]] = None,
+        batch_size: int = 64,
+        batch_interval_s: float = 0.02,
+        ring_capacity: int = 4096,
+    ) -> None:
+        """``on_batch`` erhält gepufferte Samples als GazeBatch (max. ``batch_size``
+        bzw. alle ``batch_interval_s``); ohne ``on_batch`` wird ``on_sample`` pro
+        Sample gerufen."""
+        if on_batch is None and on_sample is None:
+            raise ValueError("on_sample oder on_batch erforderlich")
         self.player = player
         self.endpoint = endpoint
         self.on_sample = on_sample
+        self.on_batch = on_batch
+        self.batch_size = batch_size
+        self.batch_interval_s = batch_interval_s
+        self._ring = GazeRing(player, max(ring_capacity, batch_size))
         self._task: Optional[asyncio.Task] = None
 
     def start(self) -> None:
@@ -27,30 +148,46 @@ class GazeStream:
         loop = asyncio.get_running_loop()
         self._task = loop.create_task(self._run(), name=f"GazeStream-{self.player}")
 
+    def _flush(self) -> None:
+        if self._ring.pending:
+            self.on_batch(self._ring.take())
+
     async def _run(self) -> None:
         cfg = NeonWSConfig(self.endpoint)
-        async for msg in neon_gaze_stream(cfg):
-            t_host_ns = time.time_ns()
-            # tolerant parsers:
-            x = msg.get("x") or msg.get("gx") or (msg.get("norm_pos") or {}).get("x")
-            y = msg.get("y") or msg.get("gy") or (msg.get("norm_pos") or {}).get("y")
-            if x is None or y is None:
-                continue
-            try:
-                x = float(x); y = float(y)
-            except Exception:
-                continue
-            conf = msg.get("confidence", msg.get("conf", msg.get("validity", None)))
-            try:
-                conf = None if conf is None else float(conf)
-            except Exception:
-                conf = None
-            t_dev = msg.get("device_time_ns", msg.get("timestamp_unix_ns", None))
-            try:
-                t_dev = int(t_dev) if t_dev is not None else t_host_ns
-            except Exception:
-                t_dev = t_host_ns
-            self.on_sample(GazeSample(self.player, x, y, conf, t_dev, t_host_ns))
+        player = self.player
+        time_ns = time.time_ns
+        if self.on_batch is None:
+            on_sample = self.on_sample
+            async for batch in neon_gaze_field_batches(cfg):
+                # ein Host-Zeitstempel pro WS-Burst (Frames lagen bereits vor)
+                t_host_ns = time_ns()
+                for x, y, conf, t_dev in batch:
+                    if x is None or y is None:
+                        continue
+                    on_sample(GazeSample(player, x, y, conf, t_host_ns if t_dev is None else t_dev, t_host_ns))
+            return
+        ring = self._ring
+        append = ring.append
+        batch_size = self.batch_size
+        interval = self.batch_interval_s
+        monotonic = time.monotonic
+        flush_at = monotonic() + interval
+        try:
+            async for batch in neon_gaze_field_batches(cfg):
+                t_host_ns = time_ns()
+                for x, y, conf, t_dev in batch:
+                    if x is None or y is None:
+                        continue
+                    pending = append(x, y, conf, t_host_ns if t_dev is None else t_dev, t_host_ns)
+                    if pending >= batch_size or ring.full:
+                        self._flush()
+                now = monotonic()
+                if now >= flush_at:
+                    self._flush()
+                    flush_at = now + interval
+        finally:
+            # Restpuffer beim Stoppen nicht verlieren
+            self._flush()
 
     def stop(self) -> None:
         if self._task and not self._task.done():
@@ -5,6 +5,35 @@ from typing import Any, Optional
 
 from .neon_client import NeonClient
 
+# Aktionen, die das Gerät selbst stempelt (kein Hostzeit-Spiegel)
+_HOSTLESS_PREFIXES = ("fix.", "sync.")
+_PLAYER_LOOKUP: dict[Any, str] = {
+    1: "p1", "1": "p1", "p1": "p1", "P1": "p1",
+    2: "p2", "2": "p2", "p2": "p2", "P2": "p2",
+}
+_ALL_PLAYERS = ("p1", "p2")
+
+
+def _canonical_player(raw: Any) -> Optional[str]:
+    try:
+        key = _PLAYER_LOOKUP.get(raw)
+    except TypeError:  # nicht hashbar
+        key = None
+    if key is None and raw is not None:
+        key = _PLAYER_LOOKUP.get(str(raw).strip().lower())
+    return key
+
+
+def _players_from_payload(payload: dict) -> tuple[str, ...]:
+    """Normalisiert payload['players'] bzw. payload['player'] einmalig auf 'p1'/'p2'."""
+    raw = payload.get("players")
+    if not raw:
+        player = payload.get("player")
+        if not player:
+            return _ALL_PLAYERS  # default beide
+        raw = (player,)
+    return tuple(k for k in map(_canonical_player, raw) if k is not None)
+
 
 class ETMarkerBridge:
     """
@@ -16,31 +45,18 @@ class ETMarkerBridge:
     def __init__(self, client_p1: Optional[NeonClient], client_p2: Optional[NeonClient]):
         self.p1 = client_p1
         self.p2 = client_p2
-
-    def _for(self, key: str) -> Optional[NeonClient]:
-        k = key.lower()
-        if k in ("1", "p1"):
-            return self.p1
-        if k in ("2", "p2"):
-            return self.p2
-        return None
+        self._clients = {"p1": client_p1, "p2": client_p2}
 
     def handle_ui_event(self, event: dict) -> None:
         action = event.get("action", "")
-        payload = event.get("payload") or {}
-        targets = payload.get("players") or [payload.get("player")] if payload.get("player") else []
-        if not targets:
-            targets = ["p1", "p2"]  # default beide
-
-        if action.startswith(("fix.", "sync.")):
-            for t in targets:
-                cli = self._for(str(t))
-                if cli:
-                    cli.send_marker(action)
-            return
+        targets = _players_from_payload(event.get("payload") or {})
 
-        t_host = time.time_ns()
-        for t in targets:
-            cli = self._for(str(t))
+        t_host = None if action.startswith(_HOSTLESS_PREFIXES) else time.time_ns()
+        clients = self._clients
+        for k in targets:
+            cli = clients.get(k)
             if cli:
-                cli.send_marker(action, t_host_ns=t_host)
+                if t_host is None:
+                    cli.send_marker(action)
+                else:
+                    cli.send_marker(action, t_host_ns=t_host)
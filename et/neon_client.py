@@ -1,12 +1,49 @@
 from __future__ import annotations
 
+import http.client
 import json
+import socket
+import threading
 import time
-import urllib.error
-import urllib.request
+from collections import deque
 from dataclasses import dataclass
 
 
+try:  # optional: orjson serialisiert direkt nach bytes
+    import orjson as _orjson
+except Exception:  # pragma: no cover - optional dependency
+    _orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+_json_loads = _orjson.loads if _orjson is not None else json.loads
+
+# Feste Request-Bodies einmalig serialisiert
+_EMPTY_BODY = _json_dumps({})
+_NO_LABEL_BODY = _json_dumps({"label": ""})
+
+# Nur diese Fehler zeigen eine vom Gerät geschlossene Keep-Alive-Verbindung an,
+# bevor eine Antwort kam. Timeouts gehören nicht dazu: der Request kann bereits
+# verarbeitet sein, eine Wiederholung würde POSTs doppelt auslösen.
+_STALE_CONN_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class _NoDelayHTTPConnection(http.client.HTTPConnection):
+    """HTTP/1.1-Verbindung mit TCP_NODELAY: kleine Marker-POSTs ohne Nagle-Verzögerung."""
+
+    def connect(self) -> None:
+        super().connect()
+        try:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+
+
 class NeonError(RuntimeError):
     ...
 
@@ -21,35 +58,90 @@ class NeonEndpoint:
 
 
 class NeonClient:
+    _JSON_HDRS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+    _NO_HDRS = {"Connection": "keep-alive"}
+
     def __init__(self, endpoint: NeonEndpoint, device_id_hint: str = "") -> None:
         self.endpoint = endpoint
         self.device_id_hint = device_id_hint or endpoint.host
         self._recording = False
+        self._timeout_s = 1.5
+        self._conn: _NoDelayHTTPConnection | None = None
+        self._http_lock = threading.Lock()
+        # SPSC-Übergabe an den Sende-Thread: deque (atomares append/popleft)
+        # plus Event zum Aufwecken statt queue.Queue mit Locks je put/get.
+        self._marker_buf: "deque[tuple[str, int | None, dict | None] | None]" = deque()
+        self._marker_wake = threading.Event()
+        self._marker_thread: threading.Thread | None = None
+        self._marker_lock = threading.Lock()
+
+    def _request(self, method: str, path: str, body: bytes | None = None) -> dict:
+        """HTTP-Request über eine persistente Keep-Alive-Verbindung.
+
+        Ist die wiederverwendete Verbindung inzwischen vom Gerät geschlossen
+        worden, wird einmal mit frischer Verbindung wiederholt. Timeouts und
+        andere Fehler werden nie wiederholt.
+        """
+        headers = self._JSON_HDRS if body is not None else self._NO_HDRS
+        with self._http_lock:
+            while True:
+                reused = self._conn is not None
+                conn = self._conn or _NoDelayHTTPConnection(
+                    self.endpoint.host, self.endpoint.port, timeout=self._timeout_s
+                )
+                try:
+                    conn.request(method, path, body=body, headers=headers)
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except _STALE_CONN_ERRORS:
+                    conn.close()
+                    self._conn = None
+                    if reused:
+                        continue
+                    raise
+                except (http.client.HTTPException, OSError):
+                    conn.close()
+                    self._conn = None
+                    raise
+                if resp.will_close:
+                    conn.close()
+                    self._conn = None
+                else:
+                    self._conn = conn
+                break
+        if resp.status >= 400:
+            raise NeonError(f"HTTP {resp.status} for {method} {path}")
+        return _json_loads(data) if data.strip() else {}
 
     def _post_json(self, path: str, payload: dict) -> dict:
-        req = urllib.request.Request(
-            url=f"{self.endpoint.base()}{path}",
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=1.5) as resp:
-            return json.loads(resp.read().decode("utf-8") or "{}")
+        return self._request("POST", path, _json_dumps(payload))
 
     def _get_json(self, path: str) -> dict:
-        with urllib.request.urlopen(f"{self.endpoint.base()}{path}", timeout=1.5) as resp:
-            return json.loads(resp.read().decode("utf-8") or "{}")
+        return self._request("GET", path)
+
+    def close(self) -> None:
+        thread = self._marker_thread
+        if thread is not None and thread.is_alive():
+            self._marker_buf.append(None)
+            self._marker_wake.set()
+            thread.join(timeout=2.0)
+        self._marker_thread = None
+        with self._http_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     async def recording_start(self, *, label: str | None = None) -> None:
         try:
-            self._post_json("/recording:start", {"label": label or ""})
+            body = _json_dumps({"label": label}) if label else _NO_LABEL_BODY
+            self._request("POST", "/recording:start", body)
             self._recording = True
         except Exception as e:
             raise NeonError(f"recording_start failed: {e}") from e
 
     async def recording_stop(self) -> None:
         try:
-            self._post_json("/recording:stop", {})
+            self._request("POST", "/recording:stop", _EMPTY_BODY)
             self._recording = False
         except Exception as e:
             raise NeonError(f"recording_stop failed: {e}") from e
@@ -62,11 +154,43 @@ class NeonClient:
             return self._recording
 
     def send_marker(self, name: str, t_host_ns: int | None = None, kv: dict | None = None) -> None:
-        payload = {"name": name, "ts_unix_ns": t_host_ns, "kv": kv or {}}
-        try:
-            self._post_json("/marker", payload)
-        except Exception:
-            pass  # tolerant
+        """Reiht den Marker ein; gesendet wird im Hintergrund-Thread (nicht blockierend).
+
+        Eingereiht wird nur ein Tupel; das JSON-Dict baut der Sende-Thread.
+        """
+        self._marker_buf.append((name, t_host_ns, kv))
+        self._marker_wake.set()
+        if self._marker_thread is None or not self._marker_thread.is_alive():
+            self._start_marker_worker()
+
+    def _start_marker_worker(self) -> None:
+        with self._marker_lock:
+            if self._marker_thread is not None and self._marker_thread.is_alive():
+                return
+            self._marker_thread = threading.Thread(
+                target=self._marker_worker,
+                name=f"NeonMarker-{self.device_id_hint}",
+                daemon=True,
+            )
+            self._marker_thread.start()
+
+    def _marker_worker(self) -> None:
+        # Jeder Marker geht sofort einzeln raus: fix.*/sync.* tragen keinen
+        # Hoststempel, das Gerät stempelt die Ankunft (kein Bündeln, kein Warten).
+        buf = self._marker_buf
+        wake = self._marker_wake
+        while True:
+            wake.wait()
+            wake.clear()
+            while buf:
+                item = buf.popleft()
+                if item is None:
+                    return
+                name, t_host_ns, kv = item
+                try:
+                    self._post_json("/marker", {"name": name, "ts_unix_ns": t_host_ns, "kv": kv or {}})
+                except Exception:
+                    pass  # tolerant
 
     def unix_time_ns(self) -> int:
         try:
@@ -1,16 +1,32 @@
 from __future__ import annotations
-import asyncio, json, time
-from dataclasses import dataclass
+import asyncio, inspect, json, random, time
+from dataclasses import dataclass, field
 from typing import AsyncIterator, Callable, Optional
 import websockets
-from websockets.client import connect
+try:  # websockets >= 13: neue asyncio-API, erlaubt recv(decode=False)
+    from websockets.asyncio.client import connect as _connect
+    _NEW_API = True
+except ImportError:  # pragma: no cover - ältere websockets-Versionen
+    from websockets.client import connect as _connect
+    _NEW_API = False
 from .config import WS_CANDIDATE_PATHS, WS_CONNECT_TIMEOUT_S
 from .neon_client import NeonEndpoint
 
+try:  # optional: orjson ist deutlich schneller als json.loads
+    import orjson as _orjson
+except Exception:  # pragma: no cover - optional dependency
+    _orjson = None
+
+_json_loads = _orjson.loads if _orjson is not None else json.loads
+
 @dataclass(slots=True)
 class NeonWSConfig:
     endpoint: NeonEndpoint
     path: Optional[str] = None  # wenn gesetzt, nur diesen Pfad probieren
+    # gelerntes Schema für den dict-Fallback (siehe _learn_parser)
+    schema_parser: Optional[Callable[[dict], tuple]] = field(default=None, repr=False, compare=False)
+    # zuletzt erfolgreiche URL, wird beim Reconnect zuerst probiert
+    preferred_url: Optional[str] = field(default=None, repr=False, compare=False)
 
 def _extract_float(d: dict, keys: tuple[str,...], default=None):
     for k in keys:
@@ -42,20 +58,118 @@ def _parse_gaze(msg: dict) -> tuple[float,float,Optional[float],Optional[int]]:
     ts = _extract_int(msg, ("device_time_ns","timestamp_unix_ns","t","ts"), None)
     return x, y, conf, ts
 
+def _first_key(d: dict, keys: tuple[str,...], conv) -> Optional[str]:
+    for k in keys:
+        if k in d:
+            try:
+                conv(d[k])
+                return k
+            except Exception:
+                pass
+    return None
+
+def _learn_parser(msg: dict) -> Optional[Callable[[dict], tuple]]:
+    """
+    Merkt sich, welche Key-Namen diese Firmware verwendet, und liefert einen
+    spezialisierten Parser mit genau einem Lookup pro Feld. Der Parser wirft
+    KeyError/TypeError/ValueError, sobald das Schema nicht mehr passt.
+    """
+    kx = _first_key(msg, ("x","gx","gaze_x"), float)
+    ky = _first_key(msg, ("y","gy","gaze_y"), float)
+    nested = None
+    if kx is None or ky is None:
+        nested = "norm_pos" if msg.get("norm_pos") else ("norm" if msg.get("norm") else None)
+        if nested is None or not isinstance(msg[nested], dict):
+            return None
+        kx = _first_key(msg[nested], ("x",), float)
+        ky = _first_key(msg[nested], ("y",), float)
+        if kx is None or ky is None:
+            return None
+    kc = _first_key(msg, ("confidence","conf","validity"), float)
+    kt = _first_key(msg, ("device_time_ns","timestamp_unix_ns","t","ts"), int)
+
+    def parse(m: dict) -> tuple[float,float,Optional[float],Optional[int]]:
+        src = m[nested] if nested is not None else m
+        c = m.get(kc) if kc is not None else None
+        t = m.get(kt) if kt is not None else None
+        return (
+            float(src[kx]),
+            float(src[ky]),
+            None if c is None else float(c),
+            None if t is None else int(t),
+        )
+
+    return parse
+
+def _unwrap(msg) -> Optional[dict]:
+    # Einige Implementationen senden {"topic":"gaze","data":{...}}
+    if isinstance(msg, dict) and "data" in msg and isinstance(msg["data"], dict):
+        return msg["data"]
+    if isinstance(msg, dict):
+        return msg
+    return None
+
+def extract_gaze_fields(buf: bytes | str, cfg: Optional[NeonWSConfig] = None) -> tuple[Optional[float],Optional[float],Optional[float],Optional[int]]:
+    """
+    Liest x, y, confidence und Zeitstempel aus dem Rohframe (orjson parst
+    bytes direkt) und wertet ihn über _parse_gaze aus; mit ``cfg`` wird das
+    dabei erkannte Schema gemerkt und für folgende Frames direkt verwendet.
+    """
+    try:
+        msg = _unwrap(_json_loads(buf))
+    except Exception:
+        return None, None, None, None
+    if msg is None:
+        return None, None, None, None
+    if cfg is None:
+        return _parse_gaze(msg)
+    parser = cfg.schema_parser
+    if parser is not None:
+        try:
+            return parser(msg)
+        except (KeyError, TypeError, ValueError):
+            cfg.schema_parser = None  # Schema geändert -> neu lernen
+    fields = _parse_gaze(msg)
+    if fields[0] is not None and fields[1] is not None:
+        cfg.schema_parser = _learn_parser(msg)
+    return fields
+
+# Neon sendet kleine, unkomprimierte JSON-Frames: keine permessage-deflate-
+# Aushandlung, Frames als bytes ohne UTF-8-Dekodierung (orjson liest bytes).
+_CONNECT_KWARGS: dict = {"compression": None, "max_size": 2**20}
+if _NEW_API and "proxy" in inspect.signature(_connect).parameters:
+    _CONNECT_KWARGS["proxy"] = None  # Geräte im LAN, kein HTTP(S)_PROXY verwenden
+
+def _open(url: str, headers: Optional[dict]):
+    if _NEW_API:
+        return _connect(url, additional_headers=headers, **_CONNECT_KWARGS)
+    return _connect(url, extra_headers=headers, **_CONNECT_KWARGS)
+
 async def _connect_first(ws_urls: list[str], headers: Optional[dict]=None):
     last_exc = None
     for url in ws_urls:
         try:
-            return await asyncio.wait_for(connect(url, extra_headers=headers), timeout=WS_CONNECT_TIMEOUT_S)
+            ws = await asyncio.wait_for(_open(url, headers), timeout=WS_CONNECT_TIMEOUT_S)
+            return url, ws
         except Exception as e:
             last_exc = e
             await asyncio.sleep(0.2)
     raise last_exc or RuntimeError("No WS URL reachable")
 
-async def neon_gaze_stream(cfg: NeonWSConfig) -> AsyncIterator[dict]:
+_DRAIN_MAX = 64
+
+def _buffered_frames(ws) -> int:
+    # Anzahl bereits empfangener, noch nicht gelesener Frames (nur neue API;
+    # internes Attribut, daher defensiv gelesen).
+    try:
+        return len(ws.recv_messages.frames)
+    except Exception:
+        return 0
+
+async def _raw_batches(cfg: NeonWSConfig) -> AsyncIterator[list[bytes | str]]:
     """
-    Liefert rohe Gaze-Objekte (dict) von Neon über WebSocket.
-    Erwartet, dass der Stream bereits Gaze-Daten sendet (keine separate Subscribe-Nachricht nötig).
+    Rohe WS-Frames inkl. Reconnect mit Backoff. Bereits gepufferte Frames
+    werden ohne Umweg über die Event-Loop als Liste gebündelt geliefert.
     """
     scheme = "ws"
     base = f"{scheme}://{cfg.endpoint.host}:{cfg.endpoint.port}"
@@ -63,22 +177,59 @@ async def neon_gaze_stream(cfg: NeonWSConfig) -> AsyncIterator[dict]:
     urls = [f"{base}{p}" for p in paths]
     backoff = 0.5
     while True:
+        preferred = cfg.preferred_url
+        if preferred in urls:
+            ordered = [preferred] + [u for u in urls if u != preferred]
+        else:
+            ordered = urls
         try:
-            async with await _connect_first(urls) as ws:
+            url, ws = await _connect_first(ordered)
+            cfg.preferred_url = url
+            async with ws:
                 backoff = 0.5
-                async for raw in ws:
-                    try:
-                        msg = json.loads(raw)
-                        # Einige Implementationen senden {"topic":"gaze","data":{...}}
-                        if isinstance(msg, dict) and "data" in msg and isinstance(msg["data"], dict):
-                            yield msg["data"]
-                        elif isinstance(msg, dict):
-                            yield msg
-                    except Exception:
-                        # parsing error -> weiter
-                        continue
+                if _NEW_API:
+                    recv = ws.recv
+                    while True:
+                        batch = [await recv(decode=False)]
+                        while len(batch) < _DRAIN_MAX and _buffered_frames(ws):
+                            # kehrt sofort zurück, der Frame liegt schon vor
+                            batch.append(await recv(decode=False))
+                        yield batch
+                else:
+                    async for raw in ws:
+                        yield [raw]
         except asyncio.CancelledError:
             raise
         except Exception:
-            await asyncio.sleep(backoff)
+            # Jitter, damit beide Streams nicht synchron neu verbinden
+            await asyncio.sleep(backoff + random.uniform(0.0, 0.25))
             backoff = min(backoff * 2, 5.0)
+
+async def neon_gaze_stream(cfg: NeonWSConfig) -> AsyncIterator[dict]:
+    """
+    Liefert rohe Gaze-Objekte (dict) von Neon über WebSocket.
+    Erwartet, dass der Stream bereits Gaze-Daten sendet (keine separate Subscribe-Nachricht nötig).
+    """
+    async for batch in _raw_batches(cfg):
+        for raw in batch:
+            try:
+                msg = _unwrap(_json_loads(raw))
+            except Exception:
+                # parsing error -> weiter
+                continue
+            if msg is not None:
+                yield msg
+
+async def neon_gaze_field_batches(cfg: NeonWSConfig) -> AsyncIterator[list[tuple[Optional[float],Optional[float],Optional[float],Optional[int]]]]:
+    """
+    Wie neon_gaze_stream, liefert aber direkt (x, y, conf, t_device_ns)
+    ohne Zwischen-dict (siehe extract_gaze_fields), je WS-Burst als Liste.
+    """
+    async for batch in _raw_batches(cfg):
+        yield [extract_gaze_fields(raw, cfg) for raw in batch]
+
+async def neon_gaze_fields(cfg: NeonWSConfig) -> AsyncIterator[tuple[Optional[float],Optional[float],Optional[float],Optional[int]]]:
+    """Einzelne (x, y, conf, t_device_ns)-Tupel, siehe neon_gaze_field_batches."""
+    async for batch in neon_gaze_field_batches(cfg):
+        for fields in batch:
+            yield fields
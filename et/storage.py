@@ -1,11 +1,37 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import io
+import logging
+import queue
 import sqlite3
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+_INS_GAZE = "INSERT INTO gaze_samples VALUES (?,?,?,?,?,?,?,?,?)"
+_INS_SYNC = "INSERT INTO sync_pairs VALUES (?,?,?,?,?,?,?)"
+
+_UTC_ISO_LAST: Tuple[int, str] = (-1, "")
+
+
+def _utc_iso_now() -> str:
+    """Aktuelle UTC-Zeit als ISO-String; innerhalb einer Millisekunde wird
+    der zuletzt formatierte String wiederverwendet (Marker-Bursts)."""
+    global _UTC_ISO_LAST
+    ns = time.time_ns()
+    ms = ns // 1_000_000
+    last_ms, last = _UTC_ISO_LAST
+    if ms == last_ms:
+        return last
+    iso = datetime.fromtimestamp(ns / 1e9, timezone.utc).isoformat()
+    _UTC_ISO_LAST = (ms, iso)
+    return iso
 
 
 class ETStorage:
@@ -13,15 +39,30 @@ class ETStorage:
     Tabellen:
     - gaze_samples(session_id, player, x, y, conf, t_device_ns, t_host_ns, t_mono_ns, t_utc_iso)
     - sync_pairs(session_id, player, kind, t_host_ns, t_device_ns, delta_ns, created_utc)
+
+    ``write_gaze``/``write_sync`` legen die Zeilen nur in eine Queue; ein
+    Hintergrund-Thread schreibt sie gebündelt (max. ``batch_size`` Zeilen bzw.
+    alle ``flush_interval_s``) mit einem einzigen Commit. ``flush()`` wartet,
+    bis alles geschrieben ist, ``close()`` beendet den Writer.
     """
 
-    def __init__(self, db_path: str, csv_dir: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: str,
+        csv_dir: Optional[str] = None,
+        *,
+        batch_size: int = 512,
+        flush_interval_s: float = 0.02,
+    ):
         self.db = Path(db_path)
         self.csv_gaze = (Path(csv_dir) / "gaze_samples.csv") if csv_dir else None
         self.csv_sync = (Path(csv_dir) / "sync_pairs.csv") if csv_dir else None
         self._lock = threading.Lock()
-        self._conn = sqlite3.connect(str(self.db), check_same_thread=False)
+        # isolation_level=None: Transaktionen werden im Writer explizit geführt
+        self._conn = sqlite3.connect(str(self.db), check_same_thread=False, isolation_level=None)
         with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL;")
+            self._conn.execute("PRAGMA synchronous=NORMAL;")
             c = self._conn.cursor()
             c.execute(
                 """CREATE TABLE IF NOT EXISTS gaze_samples(
@@ -35,25 +76,101 @@ class ETStorage:
                 t_host_ns INTEGER, t_device_ns INTEGER, delta_ns INTEGER, created_utc TEXT
             )"""
             )
-            self._conn.commit()
+        self._csv_files: dict[str, Any] = {}
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_s
+        self._closed = False
+        self._sentinel: object = object()
+        # Ein Queue-Eintrag je Aufruf (ganze Zeilenliste), nicht je Zeile
+        self._queue: "queue.Queue[Tuple[Any, Any]]" = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="ETStorageWriter", daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.close)
 
-    def write_gaze(self, rows: Iterable[Tuple[Any, ...]]) -> None:
-        rows = list(rows)
+    def _writer_loop(self) -> None:
+        gaze: List[Tuple[Any, ...]] = []
+        sync: List[Tuple[Any, ...]] = []
+        last_flush = time.monotonic()
+        while True:
+            pending = bool(gaze or sync)
+            timeout = max(0.0, self._flush_interval - (time.monotonic() - last_flush))
+            try:
+                kind, item = self._queue.get(timeout=timeout if pending else None)
+            except queue.Empty:
+                kind, item = None, None
+            if kind == "gaze":
+                gaze.extend(item)
+            elif kind == "sync":
+                sync.extend(item)
+            if kind is self._sentinel or kind == "flush" or (
+                len(gaze) + len(sync) >= self._batch_size
+            ) or time.monotonic() - last_flush >= self._flush_interval:
+                try:
+                    self._flush_rows(gaze, sync)
+                except Exception:
+                    log.exception("ETStorage: Schreiben von %d Zeilen fehlgeschlagen", len(gaze) + len(sync))
+                finally:
+                    gaze.clear()
+                    sync.clear()
+                    last_flush = time.monotonic()
+                if kind == "flush":
+                    self._flush_csv()
+                    item.set()
+                elif kind is self._sentinel:
+                    break
+
+    def _flush_rows(self, gaze: List[Tuple[Any, ...]], sync: List[Tuple[Any, ...]]) -> None:
+        if not gaze and not sync:
+            return
+        conn = self._conn
         with self._lock:
-            self._conn.executemany("INSERT INTO gaze_samples VALUES (?,?,?,?,?,?,?,?,?)", rows)
-            self._conn.commit()
-        if self.csv_gaze:
-            with self.csv_gaze.open("a", encoding="utf-8", newline="") as fp:
-                csv.writer(fp).writerows(rows)
+            conn.execute("BEGIN")
+            try:
+                if gaze:
+                    conn.executemany(_INS_GAZE, gaze)
+                if sync:
+                    conn.executemany(_INS_SYNC, sync)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        if gaze and self.csv_gaze:
+            self._csv_append("gaze", self.csv_gaze, gaze)
+        if sync and self.csv_sync:
+            self._csv_append("sync", self.csv_sync, sync)
+
+    def _csv_append(self, kind: str, path: Path, rows: List[Tuple[Any, ...]]) -> None:
+        # Format bleibt CSV (nachgelagerte Auswertung); Datei bleibt offen und
+        # jede Batch geht als ein Block in den 64-KiB-Puffer.
+        fp = self._csv_files.get(kind)
+        if fp is None:
+            fp = path.open("ab", buffering=1 << 16)
+            self._csv_files[kind] = fp
+        buf = io.StringIO(newline="")
+        csv.writer(buf).writerows(rows)
+        fp.write(buf.getvalue().encode("utf-8"))
+
+    def _flush_csv(self) -> None:
+        for fp in self._csv_files.values():
+            try:
+                fp.flush()
+            except Exception:
+                log.exception("ETStorage: CSV-Flush fehlgeschlagen")
+
+    def _enqueue(self, kind: str, rows: Iterable[Tuple[Any, ...]]) -> None:
+        if self._closed:
+            return
+        batch = list(rows)
+        if batch:
+            self._queue.put_nowait((kind, batch))
+
+    def write_gaze(self, rows: Iterable[Tuple[Any, ...]]) -> None:
+        self._enqueue("gaze", rows)
 
     def write_sync(self, rows: Iterable[Tuple[Any, ...]]) -> None:
-        rows = list(rows)
-        with self._lock:
-            self._conn.executemany("INSERT INTO sync_pairs VALUES (?,?,?,?,?,?,?)", rows)
-            self._conn.commit()
-        if self.csv_sync:
-            with self.csv_sync.open("a", encoding="utf-8", newline="") as fp:
-                csv.writer(fp).writerows(rows)
+        self._enqueue("sync", rows)
 
     def write_single_sync(self, session_id: str, player: str, kind: str, t_host_ns: int, t_device_ns: int) -> None:
         delta = int(t_device_ns) - int(t_host_ns)
@@ -64,6 +181,31 @@ class ETStorage:
             int(t_host_ns),
             int(t_device_ns),
             delta,
-            datetime.now(timezone.utc).isoformat(),
+            _utc_iso_now(),
         )
         self.write_sync([row])
+
+    def flush(self) -> None:
+        """Blockiert, bis alle bisher eingereihten Zeilen geschrieben sind."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # sonst hielte die atexit-Registrierung jede Instanz bis Prozessende
+        atexit.unregister(self.close)
+        self._queue.put((self._sentinel, None))
+        self._writer_thread.join()
+        for fp in self._csv_files.values():
+            try:
+                fp.close()
+            except Exception:
+                pass
+        self._csv_files.clear()
+        with self._lock:
+            self._conn.close()
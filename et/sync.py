@@ -4,18 +4,41 @@ from typing import Callable, Awaitable
 from .neon_client import NeonClient
 
 class NeonTimeSync:
-    def __init__(self, client: NeonClient):
-        self.client = client
+    """
+    Offset-Schätzung Gerät -> Host (Sekunden, Median mehrerer Messungen).
+
+    Entweder ``NeonTimeSync(client)`` (misst über ``client.unix_time_ns()``)
+    oder ``NeonTimeSync(device_id, measure_fn)`` mit
+    ``async measure_fn(n, timeout) -> list[float]`` wie bei
+    ``core.time_sync.TimeSyncManager``.
+    """
+
+    def __init__(
+        self,
+        client: NeonClient | str,
+        measure_fn: Callable[[int, float], Awaitable[list[float]]] | None = None,
+        *,
+        sample_timeout: float = 0.25,
+    ):
+        if measure_fn is None and isinstance(client, str):
+            raise TypeError("measure_fn erforderlich, wenn kein NeonClient übergeben wird")
+        self.client = None if isinstance(client, str) else client
+        self.device_id = client if isinstance(client, str) else client.device_id
+        self._measure_fn = measure_fn
+        self.sample_timeout = sample_timeout
 
     async def _measure_once(self) -> float:
+        # Gemessen wird gegen time.time_ns(): dieselbe Uhr, mit der Marker,
+        # Sync-Paare und Gaze-Samples ihren Hoststempel bekommen.
+        now = time.time_ns
         # host t1
-        t1 = time.time_ns()
+        t1 = now()
         d1 = self.client.unix_time_ns()
-        t2 = time.time_ns()
+        t2 = now()
         # zweite Messung für bessere Mitte
-        t3 = time.time_ns()
+        t3 = now()
         d2 = self.client.unix_time_ns()
-        t4 = time.time_ns()
+        t4 = now()
         # host midpoints
         h1 = (t1 + t2) // 2
         h2 = (t3 + t4) // 2
@@ -24,6 +47,8 @@ class NeonTimeSync:
         return (o1 + o2) / 2.0
 
     async def sample_offsets(self, n: int = 7, delay_s: float = 0.05) -> list[float]:
+        if self._measure_fn is not None:
+            return list(await self._measure_fn(max(1, n), self.sample_timeout))
         vals = []
         for _ in range(max(1, n)):
             try:
@@ -34,7 +59,7 @@ class NeonTimeSync:
         return vals
 
     async def initial(self) -> float:
-        vals = await self.sample_offsets( nine := 9, 0.03)
+        vals = await self.sample_offsets(9, 0.03)
         return statistics.median(vals) if vals else 0.0
 
     async def maybe(self, observed_drift_s: float | None = None) -> float:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
 import math
 import statistics
@@ -494,6 +495,17 @@ class TabletopApp(App):
                     stop_gaze()
                 except Exception:
                     pass
+            # Marker-Threads leeren ihre Queue beim Schließen
+            et_clients = getattr(root, "et_clients", None) or {}
+            for client in et_clients.values():
+                if client is not None:
+                    client.close()
+            et_storage = getattr(root, "et_storage", None)
+            if et_storage is not None:
+                close_fn = getattr(et_storage, "close", None)
+                if callable(close_fn):
+                    close_fn()
+                root.et_storage = None
             logger = getattr(root, "logger", None)
             if logger is not None:
                 close_fn = getattr(logger, "close", None)
@@ -538,9 +550,24 @@ def _configure_async_logging() -> tuple[Optional[QueueListener], Optional[Queue]
     return listener, log_queue
 
 
+def _install_uvloop() -> bool:
+    """Use uvloop for the gaze WebSocket readers if it is installed."""
+
+    if is_low_latency_disabled():
+        return False
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover - optional dependency (not on Windows)
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    log.info("uvloop event loop policy installed")
+    return True
+
+
 def main(*, session: Optional[int] = None, block: Optional[int] = None) -> None:
     """Run the tabletop Kivy application."""
 
+    _install_uvloop()
     logging_listener, logging_queue = _configure_async_logging()
 
     single_block_mode = session is not None and block is not None
@@ -10,22 +10,31 @@ from __future__ import annotations
 
 import atexit
 import csv
+import io
 import logging
 import queue
 import json
+import re
 import pathlib
 import sqlite3
 import threading
 import time
+from array import array
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover - only for static typing
     from tabletop.logging.events import Events
 
+try:  # optional fast JSON encoder
+    import orjson as _orjson
+except Exception:  # pragma: no cover - optional dependency
+    _orjson = None
+
 from tabletop.utils.runtime import (
+    event_log_batch_size_override,
+    event_log_flush_interval_override,
     is_low_latency_disabled,
     is_perf_logging_enabled,
 )
@@ -60,6 +69,38 @@ log = logging.getLogger(__name__)
 POINTS_PER_WIN = 3
 
 
+def _dumps_payload(payload: Dict[str, Any]) -> str:
+    """Serialise an event payload compactly (orjson when available)."""
+
+    if not payload:
+        return "{}"
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(payload, option=_orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+_ISO_SECOND_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _utc_iso_from_ns(t_ns: int) -> str:
+    """Format a UTC ISO-8601 timestamp (microseconds, ``+00:00``).
+
+    Equivalent to ``datetime.now(timezone.utc).isoformat()`` but without a
+    datetime allocation; the second-resolution prefix is cached.
+    """
+
+    global _ISO_SECOND_CACHE
+    secs, micros = divmod(t_ns // 1000, 1_000_000)
+    cached_secs, prefix = _ISO_SECOND_CACHE
+    if cached_secs != secs:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        _ISO_SECOND_CACHE = (secs, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
+
+
 # ---------------- Enums ----------------
 
 
@@ -94,30 +135,66 @@ class Call(Enum):
     BLUFF = "bluff"
 
 
+# Enum-Namen einmalig nachschlagen (pro Event und UI-Poll benötigt)
+_PHASE_NAME: Dict[Phase, str] = {p: p.name for p in Phase}
+
+# Konstante Phasenwechsel-Payloads samt vorab serialisiertem JSON
+_PHASE_CHANGE_PAYLOADS: Dict[str, Dict[str, Any]] = {
+    p.name: {"to": p.name} for p in Phase
+}
+_PHASE_CHANGE_JSON: Dict[str, str] = {
+    name: _dumps_payload(payload) for name, payload in _PHASE_CHANGE_PAYLOADS.items()
+}
+
+
 # -------------- Strukturen --------------
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundPlan:
     # Karten sind VP-bezogen (nicht rollenbezogen!)
     vp1_cards: Tuple[int, int]
     vp2_cards: Tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleMap:
     # Welche VP spielt in dieser Runde Spieler-1/Spieler-2?
     p1_is: VP
     p2_is: VP
 
 
-@dataclass
+# Feste Aufdeck-Reihenfolge: (Spieler, Karte, Fehlermeldung) je Schritt
+_REVEAL_ORDER: Tuple[Tuple[Player, int, str], ...] = (
+    (Player.P1, 0, "Zuerst: Spieler 1, Karte 1."),
+    (Player.P2, 0, "Zweitens: Spieler 2, Karte 1."),
+    (Player.P1, 1, "Drittens: Spieler 1, Karte 2."),
+    (Player.P2, 1, "Viertens: Spieler 2, Karte 2."),
+)
+# (p1_revealed, p2_revealed) nach n aufgedeckten Karten
+_REVEALED_BY_STEP: Tuple[Tuple[Tuple[bool, bool], Tuple[bool, bool]], ...] = (
+    ((False, False), (False, False)),
+    ((True, False), (False, False)),
+    ((True, False), (True, False)),
+    ((True, True), (True, False)),
+    ((True, True), (True, True)),
+)
+
+
+@dataclass(slots=True)
 class VisibleCardState:
-    p1_revealed: Tuple[bool, bool] = (False, False)  # rollenbezogen
-    p2_revealed: Tuple[bool, bool] = (False, False)
+    reveal_step: int = 0  # Anzahl aufgedeckter Karten (0–4), rollenbezogen
 
+    @property
+    def p1_revealed(self) -> Tuple[bool, bool]:
+        return _REVEALED_BY_STEP[self.reveal_step][0]
 
-@dataclass
+    @property
+    def p2_revealed(self) -> Tuple[bool, bool]:
+        return _REVEALED_BY_STEP[self.reveal_step][1]
+
+
+@dataclass(slots=True)
 class RoundState:
     index: int
     plan: RoundPlan  # VP-bezogene Karten
@@ -137,6 +214,9 @@ class RoundState:
 # -------------- CSV-Lader --------------
 
 
+_INT_CELL = re.compile(r"[+-]?\d+")
+
+
 class RoundSchedule:
     """CSV-basierte Rundenplanung.
 
@@ -147,55 +227,178 @@ class RoundSchedule:
     """
 
     def __init__(self, csv_path: str):
-        self.rounds: List[RoundPlan] = self._load(csv_path)
+        self.rounds: Tuple[RoundPlan, ...] = tuple(self._load(csv_path))
+        # Alle Karten zusammenhängend: [vp1_a, vp1_b, vp2_a, vp2_b] je Runde
+        self._cards = array(
+            "h",
+            (c for r in self.rounds for c in (*r.vp1_cards, *r.vp2_cards)),
+        )
+
+    def cards_for(self, round_idx: int) -> Tuple[int, int, int, int]:
+        """(VP1 Karte 1, VP1 Karte 2, VP2 Karte 1, VP2 Karte 2) einer Runde."""
+        i = 4 * round_idx
+        c = self._cards
+        return c[i], c[i + 1], c[i + 2], c[i + 3]
 
     def _parse_two(self, row: List[str], start: int, end: int) -> Tuple[int, int]:
         vals: List[int] = []
-        for i in range(start, min(end, len(row))):
-            cell = (row[i] or "").strip()
-            if not cell:
-                continue
-            try:
+        is_int = _INT_CELL.fullmatch
+        for cell in row[start:end]:
+            cell = cell.strip()
+            # Regex statt try/except: Kopfzeilen und Textzellen kosten keine Exception
+            if cell and is_int(cell):
                 vals.append(int(cell))
-            except ValueError:
-                continue
-            if len(vals) == 2:
-                break
+                if len(vals) == 2:
+                    break
         if len(vals) < 2:
             raise ValueError(f"Zu wenige Karten in Spalten {start + 1}–{end}.")
         return vals[0], vals[1]
 
     def _load(self, path: str) -> List[RoundPlan]:
-        with open(path, newline="", encoding="utf-8") as f:
-            rows = list(csv.reader(f))
-        start = 0
-        try:
-            self._parse_two(rows[0], 1, 5)
-            self._parse_two(rows[0], 7, 11)
-        except Exception:
-            start = 1
         out = []
-        for r in rows[start:]:
-            if not r or all((c or "").strip() == "" for c in r):
-                continue
-            vp1 = self._parse_two(r, 1, 5)
-            vp2 = self._parse_two(r, 7, 11)
-            out.append(RoundPlan(vp1_cards=vp1, vp2_cards=vp2))
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            first = next(reader, None)
+            if first is not None:
+                # Erste Zeile ist Kopfzeile, falls sie sich nicht als Runde lesen lässt
+                try:
+                    out.append(self._parse_plan(first))
+                except ValueError:
+                    pass
+            for r in reader:
+                if not r or all(not c.strip() for c in r):
+                    continue
+                out.append(self._parse_plan(r))
         if not out:
             raise ValueError("Keine Runden in CSV gefunden.")
         return out
 
+    def _parse_plan(self, row: List[str]) -> RoundPlan:
+        return RoundPlan(
+            vp1_cards=self._parse_two(row, 1, 5),
+            vp2_cards=self._parse_two(row, 7, 11),
+        )
+
 
 # -------------- Logger --------------
 
 
+# Feste SQL-Texte: sqlite3 hält die kompilierten Statements im Verbindungs-Cache
+_INS_EVENT = "INSERT INTO events VALUES (?,?,?,?,?,?,?,?)"
+_UPSERT_REFINEMENT = (
+    "INSERT OR REPLACE INTO event_refinements"
+    "(event_id, player, t_ref_ns, mapping_version, confidence, reason, created_utc)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_EVENTS = (
+    "SELECT session_id, round_idx, phase, actor, action, payload, t_mono_ns, t_utc_iso"
+    " FROM events"
+)
+_SELECT_EVENTS_BY_PAYLOAD = f"{_SELECT_EVENTS} WHERE payload LIKE ?"
+
+
+class StorageWorker(threading.Thread):
+    """Daemon thread draining a row queue in batches into ``flush_fn``.
+
+    The worker blocks until a row arrives, then drains whatever else is
+    already queued (up to ``batch_size``) without further waiting. A batch is
+    handed to ``flush_fn`` once it is full or ``flush_interval`` has passed
+    since the last flush. ``stop()`` flushes the remainder and joins.
+    """
+
+    def __init__(
+        self,
+        rows: "queue.Queue[Any]",
+        flush_fn: Any,
+        *,
+        batch_size: int,
+        flush_interval: float,
+        name: str = "StorageWorker",
+    ) -> None:
+        super().__init__(name=name, daemon=True)
+        self._rows = rows
+        self._flush_fn = flush_fn
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._sentinel: object = object()
+
+    def run(self) -> None:
+        rows = self._rows
+        sentinel = self._sentinel
+        batch_size = self._batch_size
+        pending: List[Any] = []
+        last_flush = time.monotonic()
+        stopping = False
+        while not stopping:
+            timeout = None
+            if pending:
+                timeout = max(0.0, self._flush_interval - (time.monotonic() - last_flush))
+            try:
+                item = rows.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            while item is not None:
+                rows.task_done()
+                if item is sentinel:
+                    stopping = True
+                    break
+                pending.append(item)
+                if len(pending) >= batch_size:
+                    break
+                try:
+                    item = rows.get_nowait()
+                except queue.Empty:
+                    item = None
+            if pending and (
+                stopping
+                or len(pending) >= batch_size
+                or time.monotonic() - last_flush >= self._flush_interval
+            ):
+                try:
+                    self._flush_fn(pending)
+                except Exception:  # pragma: no cover - defensive logging
+                    log.exception("%s: flushing %d rows failed", self.name, len(pending))
+                pending = []
+                last_flush = time.monotonic()
+
+    def stop(self) -> None:
+        self._rows.put(self._sentinel)
+        self.join()
+
+
 class EventLogger:
-    def __init__(self, db_path: str, csv_path: Optional[str] = None):
+    """Schreibt Events gebündelt nach SQLite.
+
+    ``sink="sqlite"`` (Standard): die SQLite-Tabelle ist die einzige Senke
+    während der Sitzung; ``csv_path`` wird bei ``close()`` in einem Rutsch aus
+    den Events dieser Instanz erzeugt. ``sink="both"`` spiegelt jede Batch
+    sofort zusätzlich in die CSV (z. B. für Live-Auswertung).
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        csv_path: Optional[str] = None,
+        *,
+        durable: bool = False,
+        sink: str = "sqlite",
+    ):
+        if sink not in ("sqlite", "both"):
+            raise ValueError(f"Unbekannte Log-Senke: {sink!r}")
         pathlib.Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self._db_lock = threading.Lock()
         with self._db_lock:
             self.conn.execute("PRAGMA journal_mode=WAL;")
+            # Mit WAL genügt NORMAL: ein Absturz kann nur die letzten Commits
+            # kosten, die DB bleibt konsistent. ``durable`` erzwingt FULL.
+            self.conn.execute(
+                "PRAGMA synchronous=FULL;" if durable else "PRAGMA synchronous=NORMAL;"
+            )
+            self.conn.execute("PRAGMA temp_store=MEMORY;")
+            self.conn.execute("PRAGMA cache_size=-20000;")
+            self.conn.execute("PRAGMA mmap_size=134217728;")
+            self.conn.execute("PRAGMA busy_timeout=5000;")
             self.conn.execute(
                 """
         CREATE TABLE IF NOT EXISTS events(
@@ -218,29 +421,36 @@ class EventLogger:
             )
             self._ensure_refinement_schema()
             self.conn.commit()
+            # Events dieser Instanz beginnen hinter der bisher höchsten rowid
+            self._first_rowid = self.conn.execute(
+                "SELECT COALESCE(MAX(rowid), 0) FROM events"
+            ).fetchone()[0]
         self._csv_path: Optional[pathlib.Path] = None
         self._closed = False
         if csv_path:
             path = pathlib.Path(csv_path)
             path.parent.mkdir(parents=True, exist_ok=True)
             self._csv_path = path
+        self._csv_live = self._csv_path is not None and sink == "both"
         self._use_async = not is_low_latency_disabled()
         self._perf_logging = is_perf_logging_enabled()
         self._queue_maxsize = 2000
-        self._batch_size = 500
-        self._flush_interval = 1.0
+        self._batch_size = event_log_batch_size_override(500)
+        self._flush_interval = event_log_flush_interval_override(1.0)
         self._last_queue_log = 0.0
-        self._queue_sentinel: object = object()
         self._event_queue: Optional[
             "queue.Queue[Tuple[str, int, str, str, str, str, int, str]]"
         ] = None
-        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[StorageWorker] = None
+        self._deferred_rows: List[Tuple[str, int, str, str, str, str, int, str]] = []
         if self._use_async:
             self._event_queue = queue.Queue(maxsize=self._queue_maxsize)
-            self._writer_thread = threading.Thread(
-                target=self._writer_loop,
+            self._writer_thread = StorageWorker(
+                self._event_queue,
+                self._flush_rows,
+                batch_size=self._batch_size,
+                flush_interval=self._flush_interval,
                 name="EventLoggerWriter",
-                daemon=True,
             )
             self._writer_thread.start()
         atexit.register(self.close)
@@ -296,36 +506,6 @@ class EventLogger:
             )
             self.conn.commit()
 
-    def _writer_loop(self) -> None:
-        assert self._event_queue is not None
-        pending: List[Tuple[str, int, str, str, str, str, int, str]] = []
-        last_flush = time.monotonic()
-        while True:
-            timeout = max(0.0, self._flush_interval - (time.monotonic() - last_flush))
-            try:
-                item = self._event_queue.get(timeout=timeout if pending else None)
-            except queue.Empty:
-                item = None
-            if item is self._queue_sentinel:
-                self._event_queue.task_done()
-                break
-            if item is None:
-                if pending:
-                    self._flush_rows(pending)
-                    pending.clear()
-                    last_flush = time.monotonic()
-                continue
-            pending.append(item)
-            self._event_queue.task_done()
-            if len(pending) >= self._batch_size or (
-                time.monotonic() - last_flush >= self._flush_interval
-            ):
-                self._flush_rows(pending)
-                pending.clear()
-                last_flush = time.monotonic()
-        if pending:
-            self._flush_rows(pending)
-
     def _flush_rows(
         self, rows: List[Tuple[str, int, str, str, str, str, int, str]]
     ) -> None:
@@ -333,11 +513,11 @@ class EventLogger:
             return
         start = time.perf_counter()
         with self._db_lock:
-            cur = self.conn.cursor()
-            cur.executemany("INSERT INTO events VALUES (?,?,?,?,?,?,?,?)", rows)
-            self.conn.commit()
-        if self._csv_path is not None:
-            with open(self._csv_path, "a", encoding="utf-8", newline="") as fp:
+            # eine Transaktion pro Batch; der Context-Manager committet
+            with self.conn:
+                self.conn.executemany(_INS_EVENT, rows)
+        if self._csv_live:
+            with _open_append(self._csv_path, "a", encoding="utf-8", newline="") as fp:
                 writer = csv.writer(fp)
                 writer.writerows(rows)
         if self._perf_logging:
@@ -352,16 +532,23 @@ class EventLogger:
         actor: str,
         action: str,
         payload: Dict[str, Any],
+        *,
+        defer: bool = False,
+        payload_json: Optional[str] = None,
     ) -> Dict[str, Any]:
+        """``defer=True``: im synchronen Modus wird die Zeile erst mit dem
+        nächsten nicht zurückgestellten Event (oder ``close()``) geschrieben.
+        ``payload_json`` ist eine bereits serialisierte Fassung von ``payload``."""
         t_mono_ns = time.perf_counter_ns()
-        t_utc_iso = datetime.now(timezone.utc).isoformat()
+        t_utc_iso = _utc_iso_from_ns(time.time_ns())
+        phase_name = _PHASE_NAME[phase]
         row = (
             session_id,
             round_idx,
-            phase.name,
+            phase_name,
             actor,
             action,
-            json.dumps(payload, ensure_ascii=False),
+            _dumps_payload(payload) if payload_json is None else payload_json,
             t_mono_ns,
             t_utc_iso,
         )
@@ -393,12 +580,17 @@ class EventLogger:
                             "Event queue at %.0f%% capacity", load * 100.0
                         )
                         self._last_queue_log = time.monotonic()
+        elif defer:
+            self._deferred_rows.append(row)
         else:
-            self._flush_rows([row])
+            rows = self._deferred_rows
+            rows.append(row)
+            self._deferred_rows = []
+            self._flush_rows(rows)
         return {
             "session_id": session_id,
             "round_idx": round_idx,
-            "phase": phase.name,
+            "phase": phase_name,
             "actor": actor,
             "action": action,
             "payload": payload,
@@ -408,15 +600,33 @@ class EventLogger:
     def close(self) -> None:
         if self._closed:
             return
-        if self._use_async and self._event_queue is not None:
-            self._event_queue.put(self._queue_sentinel)
-            self._event_queue.join()
-            if self._writer_thread is not None:
-                self._writer_thread.join(timeout=1.0)
+        if self._writer_thread is not None:
+            self._writer_thread.stop()
+        if self._deferred_rows:
+            rows, self._deferred_rows = self._deferred_rows, []
+            self._flush_rows(rows)
+        if self._csv_path is not None and not self._csv_live:
+            try:
+                self.export_csv(self._csv_path)
+            except Exception:
+                log.exception("Event CSV export to %s failed", self._csv_path)
         with self._db_lock:
             self.conn.close()
         self._closed = True
 
+    def export_csv(self, path: "str | pathlib.Path") -> int:
+        """Hängt alle Events dieser Instanz an ``path`` an; liefert die Zeilenzahl."""
+        with self._db_lock:
+            rows = self.conn.execute(
+                f"{_SELECT_EVENTS} WHERE rowid > ? ORDER BY rowid",
+                (self._first_rowid,),
+            ).fetchall()
+        if not rows:
+            return 0
+        with _open_append(pathlib.Path(path), "a", encoding="utf-8", newline="") as fp:
+            csv.writer(fp).writerows(rows)
+        return len(rows)
+
     def upsert_refinement(
         self,
         event_id: str,
@@ -426,13 +636,10 @@ class EventLogger:
         confidence: float,
         reason: str,
     ) -> None:
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = _utc_iso_from_ns(time.time_ns())
         with self._db_lock:
             self.conn.execute(
-                """
-        INSERT OR REPLACE INTO event_refinements(event_id, player, t_ref_ns, mapping_version, confidence, reason, created_utc)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+                _UPSERT_REFINEMENT,
                 (
                     event_id,
                     player,
@@ -464,16 +671,7 @@ class EventLogger:
     def fetch_events_by_event_id(self, event_id: str) -> List[Dict[str, Any]]:
         pattern = f'%"event_id":"{event_id}"%'
         with self._db_lock:
-            cur = self.conn.cursor()
-            cur.execute(
-                """
-        SELECT session_id, round_idx, phase, actor, action, payload, t_mono_ns, t_utc_iso
-        FROM events
-        WHERE payload LIKE ?
-        """,
-                (pattern,),
-            )
-            rows = cur.fetchall()
+            rows = self.conn.execute(_SELECT_EVENTS_BY_PAYLOAD, (pattern,)).fetchall()
         result: List[Dict[str, Any]] = []
         for row in rows:
             payload_raw = row[5]
@@ -506,24 +704,27 @@ def hand_value(a: int, b: int) -> int:
 
 FORCED_BLUFF_LABEL = "erzwungener_bluff"
 
+# Kategorie je Kartensumme 0–22 (Index = Summe); Werte unter 14 zählen als
+# "tief", 20–22 sind erzwungene Bluffs.
+_CATEGORY_BY_TOTAL: Tuple[Optional[SignalLevel], ...] = tuple(
+    SignalLevel.HOCH
+    if total == 19
+    else SignalLevel.MITTEL
+    if 16 <= total <= 18
+    else None
+    if total >= 20
+    else SignalLevel.TIEF
+    for total in range(23)
+)
+
 
 def hand_category(a: int, b: int) -> Optional[SignalLevel]:
     total = a + b
-    if total == 19:
-        return SignalLevel.HOCH
-    if total in (16, 17, 18):
-        return SignalLevel.MITTEL
-    if total in (14, 15):
-        return SignalLevel.TIEF
-    if total in (20, 21, 22):
-        return None
+    if 0 <= total <= 22:
+        return _CATEGORY_BY_TOTAL[total]
     # Falls Werte außerhalb des erwarteten Bereichs auftauchen, ordnen wir sie dem
     # nächsten sinnvollen Bereich zu, statt einen Laufzeitfehler zu riskieren.
-    if total > 22:
-        return None
-    if total >= 16:
-        return SignalLevel.MITTEL
-    return SignalLevel.TIEF
+    return None if total > 22 else SignalLevel.TIEF
 
 
 def hand_category_label(a: int, b: int) -> str:
@@ -531,6 +732,37 @@ def hand_category_label(a: int, b: int) -> str:
     return FORCED_BLUFF_LABEL if level is None else level.value
 
 
+def _open_append(path: pathlib.Path, mode: str, **kwargs: Any) -> IO[Any]:
+    """Öffnet ``path`` zum Anhängen; das Verzeichnis wird beim Konstruieren
+    angelegt und nur neu erzeugt, falls es zwischenzeitlich gelöscht wurde."""
+    try:
+        return open(path, mode, **kwargs)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, mode, **kwargs)
+
+
+def _row_to_bytes(row: Sequence[Any]) -> bytes:
+    """Serialisiert eine CSV-Zeile wie ``csv.writer`` (Dialekt excel, CRLF).
+
+    Die Sessionspalten sind Zahlen, Enum-Werte und Zeitstempel; nur wenn ein
+    Feld Trennzeichen, Anführungszeichen oder Zeilenumbrüche enthält, wird
+    auf das csv-Modul zurückgegriffen.
+    """
+    fields = ["" if c is None else c if c.__class__ is str else str(c) for c in row]
+    line = ",".join(fields)
+    if (
+        line.count(",") != len(fields) - 1
+        or '"' in line
+        or "\n" in line
+        or "\r" in line
+    ):
+        buf = io.StringIO(newline="")
+        csv.writer(buf).writerow(row)
+        return buf.getvalue().encode("utf-8")
+    return (line + "\r\n").encode("utf-8")
+
+
 @dataclass
 class SessionCsvLogger:
     HEADER = [
@@ -550,6 +782,8 @@ class SessionCsvLogger:
         "Punkte VP1",
         "Punkte VP2",
     ]
+    FLUSH_ROWS: ClassVar[int] = 128
+    FLUSH_INTERVAL_S: ClassVar[float] = 2.0
 
     def __init__(self, path: pathlib.Path):
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -557,26 +791,54 @@ class SessionCsvLogger:
         file_exists = path.exists()
         file_has_content = file_exists and path.stat().st_size > 0 if file_exists else False
         self._write_header = not file_has_content
-        self._buffer: List[List[Any]] = []
+        self._buffer: List[bytes] = []
+        self._last_flush = time.monotonic()
+        self._round_prefix_cache: Tuple[int, Any, Tuple[Any, ...]] = (-1, None, ())
+
+    _ACTION_LABELS: ClassVar[Dict[str, Any]] = {
+        "start_click": lambda payload: "Start",
+        "next_round_click": lambda payload: "Weiter",
+        "signal": lambda payload: payload.get("level", ""),
+        "call": lambda payload: payload.get("call", ""),
+        "reveal_card": lambda payload: (
+            f"Karte {payload['card_idx'] + 1}"
+            if payload.get("card_idx") is not None
+            else "reveal_card"
+        ),
+        "phase_change": lambda payload: f"Phase → {payload.get('to', '')}",
+        "reveal_and_score": lambda payload: "Reveal/Score",
+    }
 
     def _action_label(self, actor: str, action: str, payload: Dict[str, Any]) -> str:
-        if action == "start_click":
-            return "Start"
-        if action == "next_round_click":
-            return "Weiter"
-        if action == "signal":
-            return payload.get("level", "")
-        if action == "call":
-            return payload.get("call", "")
-        if action == "reveal_card":
-            idx = payload.get("card_idx")
-            if idx is not None:
-                return f"Karte {idx + 1}"
-        if action == "phase_change":
-            return f"Phase → {payload.get('to', '')}"
-        if action == "reveal_and_score":
-            return "Reveal/Score"
-        return action
+        label_fn = self._ACTION_LABELS.get(action)
+        return action if label_fn is None else label_fn(payload)
+
+    def _row_prefix(
+        self, cfg: "GameEngineConfig", rs: RoundState, round_idx: int
+    ) -> Tuple[Any, ...]:
+        """Return the per-round invariant columns (cached per round/plan)."""
+
+        cached_idx, cached_plan, prefix = self._round_prefix_cache
+        if cached_idx == round_idx and cached_plan is rs.plan:
+            return prefix
+        if cfg.session_number is None:
+            session_value = cfg.session_id
+        else:
+            session_value = cfg.session_number
+        vp1_cards = rs.plan.vp1_cards
+        vp2_cards = rs.plan.vp2_cards
+        prefix = (
+            session_value,
+            cfg.block,
+            cfg.condition,
+            round_idx + 1,
+            vp1_cards[0],
+            vp1_cards[1],
+            vp2_cards[0],
+            vp2_cards[1],
+        )
+        self._round_prefix_cache = (round_idx, rs.plan, prefix)
+        return prefix
 
     def log(
         self,
@@ -592,10 +854,6 @@ class SessionCsvLogger:
         is_reveal = actor == "SYS" and action == "reveal_and_score"
         if actor == "SYS" and not is_reveal:
             return
-        if cfg.session_number is None:
-            session_value = cfg.session_id
-        else:
-            session_value = cfg.session_number
 
         if actor == "P1":
             vp_actor = rs.roles.p1_is.value
@@ -604,9 +862,6 @@ class SessionCsvLogger:
         else:
             vp_actor = ""
 
-        vp1_cards = rs.plan.vp1_cards
-        vp2_cards = rs.plan.vp2_cards
-
         winner = payload.get("winner") or ""
         if not winner and rs.winner is not None:
             winner = rs.winner.value
@@ -618,24 +873,33 @@ class SessionCsvLogger:
             score_vp1 = scores.get(VP.VP1, "")
             score_vp2 = scores.get(VP.VP2, "")
 
+        session_value, block, condition, round_no, c11, c12, c21, c22 = self._row_prefix(
+            cfg, rs, round_idx
+        )
         row = [
             session_value,
-            cfg.block,
-            cfg.condition,
-            round_idx + 1,
+            block,
+            condition,
+            round_no,
             actor if actor != "SYS" else "",
             vp_actor,
-            vp1_cards[0],
-            vp1_cards[1],
-            vp2_cards[0],
-            vp2_cards[1],
+            c11,
+            c12,
+            c21,
+            c22,
             self._action_label(actor, action, payload),
             timestamp_iso,
             winner,
             score_vp1,
             score_vp2,
         ]
-        self._buffer.append(row)
+        self._buffer.append(_row_to_bytes(row))
+        # Puffer begrenzen und Datei während der Sitzung aktuell halten
+        if (
+            len(self._buffer) >= self.FLUSH_ROWS
+            or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL_S
+        ):
+            self.flush()
 
     def close(self) -> None:
         self.flush()
@@ -643,18 +907,16 @@ class SessionCsvLogger:
     def flush(self) -> None:
         if not self._buffer and not self._write_header:
             return
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._path, "a", encoding="utf-8", newline="") as fp:
-            writer = csv.writer(fp)
-            if self._write_header:
-                writer.writerow(self.HEADER)
-                self._write_header = False
-            if self._buffer:
-                writer.writerows(self._buffer)
+        if self._write_header:
+            self._buffer.insert(0, _row_to_bytes(self.HEADER))
+        with _open_append(self._path, "ab") as fp:
+            fp.write(b"".join(self._buffer))
+        self._write_header = False
         self._buffer.clear()
+        self._last_flush = time.monotonic()
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEngineConfig:
     session_id: str
     csv_path: str
@@ -666,6 +928,8 @@ class GameEngineConfig:
     log_dir: str = "logs"
     payout: bool = False
     payout_start_points: int = 0
+    durable_logging: bool = False
+    log_sink: str = "sqlite"  # "both": csv_log_path live mitschreiben
 
     def __post_init__(self) -> None:
         if self.session_number is None:
@@ -673,6 +937,21 @@ class GameEngineConfig:
             self.session_number = int(digits) if digits else None
 
 
+class _SlugTable(Dict[int, str]):
+    """Übersetzungstabelle für ``str.translate``: alphanumerisch, ``-`` und ``_``
+    bleiben, alles andere wird ``_``. Einträge werden beim ersten Auftreten
+    berechnet, damit Unicode-Buchstaben wie bisher erhalten bleiben."""
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        out = ch if ch.isalnum() or ch in "-_" else "_"
+        self[code] = out
+        return out
+
+
+_SLUG_TABLE = _SlugTable()
+
+
 class GameEngine:
     """Zentrale Spiel-Logik für die UX-Anwendung."""
 
@@ -682,14 +961,17 @@ class GameEngine:
         # Lazy import to avoid circular dependency with tabletop.logging.events
         from tabletop.logging.events import Events
 
-        self.logger: Events = Events(cfg.session_id, cfg.db_path, cfg.csv_log_path)
+        self.logger: Events = Events(
+            cfg.session_id,
+            cfg.db_path,
+            cfg.csv_log_path,
+            durable=cfg.durable_logging,
+            sink=cfg.log_sink,
+        )
         session_identifier = (
             cfg.session_number if cfg.session_number is not None else cfg.session_id
         )
-        condition_slug = "".join(
-            ch if ch.isalnum() or ch in ("-", "_") else "_"
-            for ch in cfg.condition.lower()
-        )
+        condition_slug = cfg.condition.lower().translate(_SLUG_TABLE)
         session_csv_path = pathlib.Path(cfg.log_dir) / (
             f"session_{session_identifier}_{condition_slug}.csv"
         )
@@ -702,6 +984,8 @@ class GameEngine:
         roles = RoleMap(p1_is=VP.VP1, p2_is=VP.VP2)
         self.round_idx = 0
         self.current = RoundState(index=0, plan=self.schedule.rounds[0], roles=roles)
+        # Zwischengespeicherter get_public_state(); None = neu aufbauen
+        self._public_state: Optional[Dict[str, Any]] = None
 
     # --- Hilfen ---
     def _ensure(self, allowed: List[Phase]) -> None:
@@ -720,6 +1004,8 @@ class GameEngine:
         payload: Dict[str, Any],
         round_index_override: Optional[int] = None,
     ) -> None:
+        # Jede Zustandsänderung wird protokolliert -> Snapshot hier verwerfen
+        self._public_state = None
         round_idx = (
             self.current.index if round_index_override is None else round_index_override
         )
@@ -735,14 +1021,34 @@ class GameEngine:
             scores=self._score_snapshot(),
         )
 
+    def _log_phase_change(self, to: str, roles: Optional[RoleMap] = None) -> None:
+        """Phasenwechsel sind reine Systemereignisse: kein Eintrag in der
+        Session-CSV, und der DB-Eintrag darf mit dem nächsten Ereignis
+        gebündelt geschrieben werden."""
+        self._public_state = None
+        if roles is None:
+            payload = _PHASE_CHANGE_PAYLOADS[to]
+            payload_json: Optional[str] = _PHASE_CHANGE_JSON[to]
+        else:
+            payload = {
+                "to": to,
+                "roles": {"P1": roles.p1_is.value, "P2": roles.p2_is.value},
+            }
+            payload_json = None
+        self.logger.log(
+            self.current.index,
+            self.current.phase,
+            "SYS",
+            "phase_change",
+            payload,
+            defer=True,
+            payload_json=payload_json,
+        )
+
     def _cards_of(self, player: Player) -> Tuple[int, int]:
         # Hole Karten der VP, die aktuell diese Spielerrolle hat
-        vp = self.current.roles.p1_is if player == Player.P1 else self.current.roles.p2_is
-        return (
-            self.current.plan.vp1_cards
-            if vp == VP.VP1
-            else self.current.plan.vp2_cards
-        )
+        a1, b1, a2, b2 = self._hand_cards()
+        return (a1, b1) if player == Player.P1 else (a2, b2)
 
     def _update_scores(self, winner: Optional[Player]) -> None:
         if self.scores is None or winner is None:
@@ -767,7 +1073,7 @@ class GameEngine:
             self._log("P2", "start_click", {})
         if self.current.p1_ready and self.current.p2_ready:
             self.current.phase = Phase.DEALING
-            self._log("SYS", "phase_change", {"to": "DEALING"})
+            self._log_phase_change("DEALING")
 
     def click_reveal_card(self, player: Player, card_idx: int) -> None:
         """Rollenbezogenes Aufdecken in fixer Reihenfolge."""
@@ -778,26 +1084,16 @@ class GameEngine:
         v = self.current.vis
 
         # Reihenfolge erzwingen:
-        if not v.p1_revealed[0]:
-            if player != Player.P1 or card_idx != 0:
-                raise RuntimeError("Zuerst: Spieler 1, Karte 1.")
-            v.p1_revealed = (True, v.p1_revealed[1])
-        elif not v.p2_revealed[0]:
-            if player != Player.P2 or card_idx != 0:
-                raise RuntimeError("Zweitens: Spieler 2, Karte 1.")
-            v.p2_revealed = (True, v.p2_revealed[1])
-        elif not v.p1_revealed[1]:
-            if player != Player.P1 or card_idx != 1:
-                raise RuntimeError("Drittens: Spieler 1, Karte 2.")
-            v.p1_revealed = (v.p1_revealed[0], True)
-        elif not v.p2_revealed[1]:
-            if player != Player.P2 or card_idx != 1:
-                raise RuntimeError("Viertens: Spieler 2, Karte 2.")
-            v.p2_revealed = (v.p2_revealed[0], True)
-            self.current.phase = Phase.SIGNAL_WAIT
-            self._log("SYS", "phase_change", {"to": "SIGNAL_WAIT"})
-        else:
+        step = v.reveal_step
+        if step >= len(_REVEAL_ORDER):
             raise RuntimeError("Alle Karten bereits aufgedeckt.")
+        exp_player, exp_idx, message = _REVEAL_ORDER[step]
+        if player != exp_player or card_idx != exp_idx:
+            raise RuntimeError(message)
+        v.reveal_step = step + 1
+        if v.reveal_step == len(_REVEAL_ORDER):
+            self.current.phase = Phase.SIGNAL_WAIT
+            self._log_phase_change("SIGNAL_WAIT")
 
         # Wert loggen (rollenrichtig, aber VP-Karte)
         c1, c2 = self._cards_of(player)
@@ -823,7 +1119,7 @@ class GameEngine:
         self.current.p1_signal = level
         self._log("P1", "signal", {"level": level.value})
         self.current.phase = Phase.CALL_WAIT
-        self._log("SYS", "phase_change", {"to": "CALL_WAIT"})
+        self._log_phase_change("CALL_WAIT")
 
     def p2_call(self, call: Call, p1_hat_wahrheit_gesagt: Optional[bool]) -> None:
         self._ensure([Phase.CALL_WAIT])
@@ -878,7 +1174,7 @@ class GameEngine:
         )
 
         self.current.phase = Phase.ROUND_DONE
-        self._log("SYS", "phase_change", {"to": "ROUND_DONE"})
+        self._log_phase_change("ROUND_DONE")
 
     def click_next_round(self, player: Player) -> None:
         """Beide drücken 'Nächste Runde'. Danach: Rollen tauschen."""
@@ -897,10 +1193,14 @@ class GameEngine:
     # --- State-Exposure ---
 
     def get_public_state(self) -> Dict[str, Any]:
+        """Snapshot für die UI; bis zur nächsten Zustandsänderung wird dasselbe
+        (nicht zu verändernde) Dict geliefert."""
+        if self._public_state is not None:
+            return self._public_state
         rs = self.current
-        return {
+        self._public_state = {
             "round_index": rs.index,
-            "phase": rs.phase.name,
+            "phase": _PHASE_NAME[rs.phase],
             "roles": {
                 "P1": rs.roles.p1_is.value,
                 "P2": rs.roles.p2_is.value,
@@ -922,37 +1222,34 @@ class GameEngine:
                 VP.VP2.value: self.scores[VP.VP2],
             },
         }
+        return self._public_state
 
     # --- Interna ---
 
-    def _determine_truth(
-        self,
-    ) -> Tuple[Optional[bool], Optional[SignalLevel], Optional[SignalLevel]]:
-        signal = self.current.p1_signal
-        if signal is None:
-            return (None, None, None)
-        p1_cards = self._cards_of(Player.P1)
-        p2_cards = self._cards_of(Player.P2)
-        p1_category = hand_category(*p1_cards)
-        p2_category = hand_category(*p2_cards)
-        return (signal == p1_category, p1_category, p2_category)
+    def _hand_cards(self) -> Tuple[int, int, int, int]:
+        """(P1 Karte 1, P1 Karte 2, P2 Karte 1, P2 Karte 2) gemäß aktueller
+        Rollenverteilung; einzige Stelle, die Karten aus dem Plan auflöst."""
+        vp1_a, vp1_b, vp2_a, vp2_b = self.schedule.cards_for(self.current.index)
+        if self.current.roles.p1_is == VP.VP1:
+            return vp1_a, vp1_b, vp2_a, vp2_b
+        return vp2_a, vp2_b, vp1_a, vp1_b
 
     def _resolve_outcome(self, call: Call) -> Tuple[Optional[Player], str, Optional[bool]]:
-        actual_truth, p1_category, _ = self._determine_truth()
-        forced_bluff = p1_category is None
-
-        if actual_truth is None:
+        signal = self.current.p1_signal
+        if signal is None:
             return (
                 None,
                 "Unbestimmt: Kein Signal gesetzt, Ergebnis kann nicht berechnet werden.",
                 None,
             )
 
-        # Werte für Vergleich (20/21/22 werden als 0 behandelt)
-        p1_cards = self._cards_of(Player.P1)
-        p2_cards = self._cards_of(Player.P2)
-        p1_val = hand_value(*p1_cards)
-        p2_val = hand_value(*p2_cards)
+        # Karten nur einmal auflösen; Kategorie und Wert (20/21/22 → 0) daraus ableiten
+        a1, b1, a2, b2 = self._hand_cards()
+        p1_category = hand_category(a1, b1)
+        forced_bluff = p1_category is None
+        actual_truth = signal == p1_category
+        p1_val = hand_value(a1, b1)
+        p2_val = hand_value(a2, b2)
 
         if call == Call.BLUFF:
             if actual_truth:
@@ -1016,7 +1313,7 @@ class GameEngine:
         self.round_idx += 1
         if self.round_idx >= len(self.schedule.rounds):
             self.current.phase = Phase.FINISHED
-            self._log("SYS", "phase_change", {"to": "FINISHED"})
+            self._log_phase_change("FINISHED")
             return
 
         # Rollen tauschen:
@@ -1030,17 +1327,7 @@ class GameEngine:
             roles=new_roles,
             phase=Phase.DEALING,  # nächste Runde beginnt direkt mit Aufdecken
         )
-        self._log(
-            "SYS",
-            "phase_change",
-            {
-                "to": "DEALING",
-                "roles": {
-                    "P1": new_roles.p1_is.value,
-                    "P2": new_roles.p2_is.value,
-                },
-            },
-        )
+        self._log_phase_change("DEALING", new_roles)
 
     # --- Cleanup ---
 
@@ -12,9 +12,17 @@ __all__ = ["Events", "EnginePhase"]
 class Events:
     """Thin wrapper around :class:`tabletop.engine.EventLogger`."""
 
-    def __init__(self, session_id: str, db_path: str, csv_path: Optional[str] = None):
+    def __init__(
+        self,
+        session_id: str,
+        db_path: str,
+        csv_path: Optional[str] = None,
+        *,
+        durable: bool = False,
+        sink: str = "sqlite",
+    ):
         self._session_id = session_id
-        self._logger = EventLogger(db_path, csv_path)
+        self._logger = EventLogger(db_path, csv_path, durable=durable, sink=sink)
 
     def log(
         self,
@@ -23,6 +31,9 @@ class Events:
         actor: str,
         action: str,
         payload: Optional[Dict[str, Any]] = None,
+        *,
+        defer: bool = False,
+        payload_json: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Forward events to the underlying logger while fixing defaults."""
 
@@ -33,6 +44,8 @@ class Events:
             actor,
             action,
             payload or {},
+            defer=defer,
+            payload_json=payload_json,
         )
 
     def close(self) -> None:
@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
 import csv
+import io
 import logging
+import os
 import queue
+import sys
 import threading
 import time
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-
-try:  # Optional dependency used when available.
-    import pandas as _pd  # type: ignore
-except Exception:  # pragma: no cover - pandas is optional at runtime
-    _pd = None
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Sequence, Tuple
 
 from tabletop.utils.runtime import (
     is_low_latency_disabled,
@@ -28,25 +28,133 @@ _PERF_LOGGING = is_perf_logging_enabled()
 _ROUND_QUEUE_MAXSIZE = 8
 _ROUND_BUFFER_MAX = 500
 _ROUND_FLUSH_INTERVAL = 1.0
-_ROUND_QUEUE: Optional[
-    queue.Queue[Tuple[Path, List[Dict[str, Any]], List[str], bool]]
-] = None
+# Adaptive thresholds: bursts (< 50 ms between events) flush less often,
+# sparse events (> 500 ms) sooner.
+_EWMA_ALPHA = 0.2
+_BURST_GAP_S = 0.05
+_IDLE_GAP_S = 0.5
+_ROUND_QUEUE: Optional["_RoundWriteRing"] = None
 _ROUND_QUEUE_LOCK = threading.Lock()
 _ROUND_WRITER: Optional[threading.Thread] = None
+# Append handles stay open across flushes (few sessions per process).
+_ROUND_FILES: Dict[Path, BinaryIO] = {}
+_ROUND_FILES_LOCK = threading.Lock()
+_ROUND_FILES_MAX = 4
+# Logs are append-only and never read back: hint sequential access and drop
+# written pages from the page cache every N flushes (POSIX only).
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+_ROUND_FADVISE_EVERY = 64
+_ROUND_FILE_FLUSHES: Dict[Path, int] = {}
+_VP_LABEL: Dict[Any, str] = {1: "VP1", 2: "VP2"}
+_SYSTEM_ACTIONS = frozenset({"session_start", "fixation_flash", "fixation_beep"})
+
+
+_TS_MINUTE_CACHE: Tuple[int, str] = (-1, "")
+_TS_LAST: Tuple[int, str] = (-1, "")
+
+
+def _clock_timestamp() -> str:
+    """Local wall-clock time as ``HH:MM:SS.mmm``.
+
+    The ``HH:MM:`` prefix is formatted once per minute; seconds and
+    milliseconds are filled in with integer arithmetic, and events within
+    the same millisecond reuse the previous string.
+    """
+
+    global _TS_MINUTE_CACHE, _TS_LAST
+    ms = int(time.time() * 1000)
+    last_ms, last = _TS_LAST
+    if ms == last_ms:
+        return last
+    minute, millis = divmod(ms, 60000)
+    cached_minute, prefix = _TS_MINUTE_CACHE
+    if cached_minute != minute:
+        prefix = time.strftime("%H:%M:", time.localtime(minute * 60))
+        _TS_MINUTE_CACHE = (minute, prefix)
+    stamp = f"{prefix}{millis // 1000:02d}.{millis % 1000:03d}"
+    _TS_LAST = (ms, stamp)
+    return stamp
+
+
+@dataclass(slots=True)
+class RoundLogContext:
+    """Per-session logging state; built by :func:`init_round_log`.
+
+    Rows from :func:`write_round_log` are buffered column-wise in
+    ``columns`` (one list per ``ROUND_LOG_HEADER`` entry) and only zipped
+    into rows at flush time. ``buffer`` mirrors
+    ``app.round_log_buffer`` (swapped on each flush) and still accepts
+    externally added rows; ``external_marks`` records where those rows
+    arrived relative to the column buffer so a flush keeps arrival order.
+    """
+
+    path: Path
+    log_dir: Path
+    buffer: List[Any]
+    columns: Tuple[List[Any], ...]
+    fieldnames: List[str]
+    header_written: bool
+    flush_interval: float = _ROUND_FLUSH_INTERVAL
+    buffer_max: int = _ROUND_BUFFER_MAX
+    event_gap_ewma: Optional[float] = None
+    last_event: Optional[float] = None
+    # Bumped per buffered event; a flush records the generation it drained.
+    generation: int = 0
+    flushed_generation: int = 0
+    # (column rows, external rows) seen at each point external rows arrived.
+    external_marks: List[Tuple[int, int]] = field(default_factory=list)
+    external_seen: int = 0
+    # Per-session/per-round constants; see :meth:`spieler1_label`.
+    session_str: str = ""
+    first_player: Any = None
+    role_by_physical: Any = None
+    spieler1_vp: str = ""
+
+    def pending(self) -> int:
+        return len(self.columns[0]) + len(self.buffer)
+
+    def spieler1_label(self, first_player: Any, role_by_physical: Dict[int, int]) -> str:
+        """``Spieler 1`` column; recomputed only when the turn order or the
+        role mapping (replaced, never mutated, by the view) changes."""
+
+        if first_player != self.first_player or role_by_physical is not self.role_by_physical:
+            self.first_player = first_player
+            self.role_by_physical = role_by_physical
+            self.spieler1_vp = (
+                _VP_LABEL.get(role_by_physical.get(first_player), "")
+                if first_player in (1, 2)
+                else ""
+            )
+        return self.spieler1_vp
+
+    def note_event(self, now: float) -> None:
+        """Adapt flush thresholds to the event rate (EWMA of inter-event gaps)."""
+
+        last = self.last_event
+        self.last_event = now
+        if last is None:
+            return
+        gap = now - last
+        ewma = self.event_gap_ewma
+        ewma = gap if ewma is None else ewma + _EWMA_ALPHA * (gap - ewma)
+        self.event_gap_ewma = ewma
+        if ewma < _BURST_GAP_S:
+            self.flush_interval, self.buffer_max = 2.0, 2000
+        elif ewma > _IDLE_GAP_S:
+            self.flush_interval, self.buffer_max = 0.25, 50
+        else:
+            self.flush_interval, self.buffer_max = _ROUND_FLUSH_INTERVAL, _ROUND_BUFFER_MAX
 
 
 def _write_round_rows(
     path: Path,
-    rows: List[Dict[str, Any]],
+    rows: List[Sequence[Any]],
     fieldnames: List[str],
     write_header: bool,
 ) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a", encoding="utf-8", newline="") as fp:
-        writer = csv.DictWriter(fp, fieldnames=fieldnames, restval="")
-        if write_header:
-            writer.writeheader()
-        writer.writerows(rows)
+    buf = io.StringIO(newline="")
+    _encode_round_rows(buf, rows, fieldnames, write_header)
+    _append_round_bytes(path, buf.getvalue().encode("utf-8"))
 
 
 def _extend_fieldnames(fieldnames: List[str], row: Dict[str, Any]) -> None:
@@ -55,54 +163,223 @@ def _extend_fieldnames(fieldnames: List[str], row: Dict[str, Any]) -> None:
             fieldnames.append(key)
 
 
-def _sequence_row_to_dict(row: Sequence[Any]) -> Dict[str, Any]:
-    mapping: Dict[str, Any] = {}
-    for idx, key in enumerate(ROUND_LOG_HEADER):
-        mapping[key] = row[idx] if idx < len(row) else ""
-    return mapping
-
-
-def _round_writer_loop(
-    queue_obj: queue.Queue[Tuple[Path, List[Dict[str, Any]], List[str], bool]]
+def _encode_round_rows(
+    buf: io.StringIO,
+    rows: List[Sequence[Any]],
+    fieldnames: List[str],
+    write_header: bool,
 ) -> None:
+    """Encode value rows (already in ``fieldnames`` order) as CSV into ``buf``."""
+    if write_header:
+        if fieldnames == ROUND_LOG_HEADER:
+            buf.write(_ROUND_LOG_HEADER_LINE)
+        else:
+            csv.DictWriter(buf, fieldnames=fieldnames).writeheader()
+    slow_writer = None
+    lines: List[str] = []
+    for row in rows:
+        fields = ["" if v is None else v if v.__class__ is str else str(v) for v in row]
+        line = ",".join(fields)
+        # Plain join matches csv's excel dialect unless a field needs quoting.
+        if (
+            line.count(",") == len(fields) - 1
+            and '"' not in line
+            and "\n" not in line
+            and "\r" not in line
+        ):
+            lines.append(line)
+            lines.append("\r\n")
+            continue
+        if lines:
+            buf.write("".join(lines))
+            lines.clear()
+        if slow_writer is None:
+            slow_writer = csv.writer(buf)
+        slow_writer.writerow(fields)
+    if lines:
+        buf.write("".join(lines))
+
+
+def _append_round_bytes(path: Path, data: bytes) -> None:
+    """Append ``data`` to ``path`` through a cached, buffered binary handle."""
+
+    with _ROUND_FILES_LOCK:
+        fp = _ROUND_FILES.get(path)
+        if fp is None:
+            if len(_ROUND_FILES) >= _ROUND_FILES_MAX:
+                oldest = next(iter(_ROUND_FILES))
+                _ROUND_FILES.pop(oldest).close()
+                _ROUND_FILE_FLUSHES.pop(oldest, None)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fp = open(path, "ab", buffering=1 << 16)
+            _ROUND_FILES[path] = fp
+            _ROUND_FILE_FLUSHES[path] = 0
+            if _HAS_FADVISE:
+                try:
+                    os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+        fp.write(data)
+        fp.flush()
+        if _HAS_FADVISE:
+            flushes = _ROUND_FILE_FLUSHES.get(path, 0) + 1
+            if flushes >= _ROUND_FADVISE_EVERY:
+                flushes = 0
+                try:
+                    os.posix_fadvise(fp.fileno(), 0, fp.tell(), os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
+            _ROUND_FILE_FLUSHES[path] = flushes
+
+
+def _release_round_file(path: Path) -> None:
+    with _ROUND_FILES_LOCK:
+        fp = _ROUND_FILES.pop(path, None)
+        _ROUND_FILE_FLUSHES.pop(path, None)
+    if fp is not None:
+        fp.close()
+
+
+def _close_round_files() -> None:
+    with _ROUND_FILES_LOCK:
+        for fp in _ROUND_FILES.values():
+            try:
+                fp.close()
+            except Exception:  # pragma: no cover - best effort at exit
+                pass
+        _ROUND_FILES.clear()
+        _ROUND_FILE_FLUSHES.clear()
+
+
+atexit.register(_close_round_files)
+
+
+_RoundBatch = Tuple[Path, List[Sequence[Any]], List[str], bool]
+
+
+class _RoundWriteRing:
+    """Single-producer/single-consumer hand-off to the writer thread.
+
+    ``put_nowait`` and ``drain`` only touch a deque (atomic append/popleft)
+    and a wake-up Event that is set solely when the consumer may be asleep;
+    the Condition is used only to report completed batches to ``join``.
+    Mirrors the subset of :class:`queue.Queue` used here.
+
+    When the ring is full, batches go to an unbounded overflow list instead
+    of being written on the caller's thread; ``overflowed`` counts them.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._items: Deque[_RoundBatch] = deque()
+        self._wake = threading.Event()
+        self._done = threading.Condition()
+        self._put_count = 0
+        self._done_count = 0
+        self._overflow: List[_RoundBatch] = []
+        self._overflow_lock = threading.Lock()
+        self.overflowed = 0
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, item: _RoundBatch) -> None:
+        # While overflow is pending, new batches must queue behind it.
+        if len(self._items) >= self.maxsize or self._overflow:
+            raise queue.Full
+        self._items.append(item)
+        self._put_count += 1
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def put_overflow(self, item: _RoundBatch) -> int:
+        """Park ``item`` for the writer without blocking; returns the overflow count."""
+
+        with self._overflow_lock:
+            self._overflow.append(item)
+            self._put_count += 1
+            self.overflowed += 1
+            count = self.overflowed
+        self._wake.set()
+        return count
+
+    def drain(self) -> List[_RoundBatch]:
+        """Block until at least one batch is available and return all of them."""
+
+        popleft = self._items.popleft
+        while True:
+            self._wake.wait()
+            # Clear before draining: anything appended afterwards sets the Event again.
+            self._wake.clear()
+            items: List[_RoundBatch] = []
+            while True:
+                try:
+                    items.append(popleft())
+                except IndexError:
+                    break
+            # Overflow batches are newer than everything left in the deque.
+            if self._overflow:
+                with self._overflow_lock:
+                    items.extend(self._overflow)
+                    self._overflow.clear()
+            if items:
+                return items
+
+    def task_done(self, count: int = 1) -> None:
+        with self._done:
+            self._done_count += count
+            self._done.notify_all()
+
+    def join(self) -> None:
+        target = self._put_count
+        with self._done:
+            self._done.wait_for(lambda: self._done_count >= target)
+
+
+def _round_writer_loop(ring: _RoundWriteRing) -> None:
     while True:
-        path, rows, fieldnames, write_header = queue_obj.get()
+        # Take everything queued and write it with a single append per file.
+        items = ring.drain()
         start = time.perf_counter()
+        n_rows = sum(len(item[1]) for item in items)
         try:
-            _write_round_rows(path, rows, fieldnames, write_header)
+            by_path: Dict[Path, io.StringIO] = {}
+            for path, rows, fieldnames, write_header in items:
+                buf = by_path.get(path)
+                if buf is None:
+                    buf = by_path[path] = io.StringIO(newline="")
+                _encode_round_rows(buf, rows, fieldnames, write_header)
+            for path, buf in by_path.items():
+                _append_round_bytes(path, buf.getvalue().encode("utf-8"))
             if _PERF_LOGGING:
                 duration = (time.perf_counter() - start) * 1000.0
                 log.debug(
-                    "Round CSV flush wrote %d rows in %.2f ms", len(rows), duration
+                    "Round CSV flush wrote %d rows in %.2f ms", n_rows, duration
                 )
         except Exception:  # pragma: no cover - defensive logging
-            log.exception("Failed to flush %d round log rows", len(rows))
+            log.exception("Failed to flush %d round log rows", n_rows)
         finally:
-            queue_obj.task_done()
+            ring.task_done(len(items))
 
 
-def _ensure_round_writer() -> queue.Queue[Tuple[Path, List[Dict[str, Any]], List[str], bool]]:
+def _ensure_round_writer() -> _RoundWriteRing:
     global _ROUND_QUEUE, _ROUND_WRITER
     if _ROUND_QUEUE is not None:
         return _ROUND_QUEUE
     with _ROUND_QUEUE_LOCK:
         if _ROUND_QUEUE is not None:
             return _ROUND_QUEUE
-        queue_obj: queue.Queue[
-            Tuple[Path, List[Dict[str, Any]], List[str], bool]
-        ] = queue.Queue(
-            maxsize=_ROUND_QUEUE_MAXSIZE
-        )
+        ring = _RoundWriteRing(maxsize=_ROUND_QUEUE_MAXSIZE)
         writer_thread = threading.Thread(
             target=_round_writer_loop,
-            args=(queue_obj,),
+            args=(ring,),
             name="RoundCsvWriter",
             daemon=True,
         )
         writer_thread.start()
-        _ROUND_QUEUE = queue_obj
+        _ROUND_QUEUE = ring
         _ROUND_WRITER = writer_thread
-        return queue_obj
+        return ring
 
 
 ROUND_LOG_HEADER: List[str] = [
@@ -122,6 +399,7 @@ ROUND_LOG_HEADER: List[str] = [
     "Punktestand VP1",
     "Punktestand VP2",
 ]
+_ROUND_LOG_HEADER_LINE = ",".join(ROUND_LOG_HEADER) + "\r\n"
 
 
 def init_round_log(app: Any) -> None:
@@ -142,54 +420,67 @@ def init_round_log(app: Any) -> None:
         buffer.clear()
     app.round_log_fieldnames = list(ROUND_LOG_HEADER)
     app.round_log_last_flush = time.monotonic()
+    app.round_log_ctx = RoundLogContext(
+        path=path,
+        log_dir=app.log_dir,
+        buffer=app.round_log_buffer,
+        columns=tuple([] for _ in ROUND_LOG_HEADER),
+        fieldnames=app.round_log_fieldnames,
+        header_written=path.exists() and path.stat().st_size > 0,
+        session_str=sys.intern(app.session_id or ""),
+    )
+    app.round_log_enabled = True
+
+
+_STATIC_LABELS: Dict[str, str] = {
+    "start_click": "Start",
+    "round_start": "Start",
+    "next_round_click": "Nächste Runde",
+    "reveal_inner": "Karte 1",
+    "reveal_outer": "Karte 2",
+    "showdown": "Showdown",
+    "session_start": "Session",
+    "fixation_flash": "Fixation Flash",
+    "fixation_beep": "Fixation Ton",
+}
 
 
 def round_log_action_label(app: Any, action: str, payload: Dict[str, Any]) -> str:
-    if action in ("start_click", "round_start"):
-        return "Start"
-    if action == "next_round_click":
-        return "Nächste Runde"
-    if action == "reveal_inner":
-        return "Karte 1"
-    if action == "reveal_outer":
-        return "Karte 2"
+    label = _STATIC_LABELS.get(action)
+    if label is not None:
+        return label
     if action == "signal_choice":
         return app.format_signal_choice(payload.get("level")) or "Signal"
     if action == "call_choice":
         return app.format_decision_choice(payload.get("decision")) or "Entscheidung"
-    if action == "showdown":
-        return "Showdown"
-    if action == "session_start":
-        return "Session"
-    if action == "fixation_flash":
-        return "Fixation Flash"
-    if action == "fixation_beep":
-        return "Fixation Ton"
     return action
 
 
 def write_round_log(app: Any, actor: str, action: str, payload: Dict[str, Any], player: int) -> None:
-    if not getattr(app, "round_log_path", None):
+    if not app.round_log_enabled:
         return
+    ctx: RoundLogContext = app.round_log_ctx
     is_showdown = action == "showdown"
-    system_actions = {"session_start", "fixation_flash", "fixation_beep"}
-    is_system_event = action in system_actions
+    is_system_event = action in _SYSTEM_ACTIONS
     if not is_showdown and not is_system_event and player not in (1, 2):
         return
 
     block_condition = ""
     block_number = ""
     round_in_block = ""
-    if getattr(app, "current_block_info", None):
+    block_info = getattr(app, "current_block_info", None)
+    if block_info:
         block_condition = "pay" if app.current_round_has_stake else "no_pay"
-        block_number = app.current_block_info["index"]
+        block_number = block_info["index"]
         round_in_block = app.round_in_block
-    elif getattr(app, "next_block_preview", None):
-        block = app.next_block_preview.get("block")
-        if block:
-            block_condition = "pay" if block.get("payout") else "no_pay"
-            block_number = block.get("index", "")
-            round_in_block = app.next_block_preview.get("round_in_block", "")
+    else:
+        preview = getattr(app, "next_block_preview", None)
+        if preview:
+            block = preview.get("block")
+            if block:
+                block_condition = "pay" if block.get("payout") else "no_pay"
+                block_number = block.get("index", "")
+                round_in_block = preview.get("round_in_block", "")
 
     plan = None
     plan_info = app.get_current_plan()
@@ -202,73 +493,102 @@ def write_round_log(app: Any, actor: str, action: str, payload: Dict[str, Any],
     if not vp2_cards:
         vp2_cards = (None, None)
 
+    role_by_physical = app.role_by_physical
     actor_vp = ""
     if not is_showdown and player in (1, 2):
-        vp_num = app.role_by_physical.get(player)
-        if vp_num in (1, 2):
-            actor_vp = f"VP{vp_num}"
+        actor_vp = _VP_LABEL.get(role_by_physical.get(player), "")
 
-    spieler1_vp = ""
-    first_player = app.first_player if app.first_player in (1, 2) else None
-    if first_player is not None:
-        vp_player1 = app.role_by_physical.get(first_player)
-        if vp_player1 in (1, 2):
-            spieler1_vp = f"VP{vp_player1}"
+    spieler1_vp = ctx.spieler1_label(app.first_player, role_by_physical)
 
     action_label = round_log_action_label(app, action, payload)
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    timestamp = _clock_timestamp()
 
     winner_label = ""
     if is_showdown:
         winner_player = payload.get("winner")
         if winner_player in (1, 2):
-            winner_vp = app.role_by_physical.get(winner_player)
-            if winner_vp in (1, 2):
-                winner_label = f"VP{winner_vp}"
-
-    if getattr(app, "score_state", None):
-        score_vp1 = app.score_state.get(1, "")
-        score_vp2 = app.score_state.get(2, "")
-    elif getattr(app, "score_state_round_start", None):
-        score_vp1 = app.score_state_round_start.get(1, "")
-        score_vp2 = app.score_state_round_start.get(2, "")
+            winner_label = _VP_LABEL.get(role_by_physical.get(winner_player), "")
+
+    scores = getattr(app, "score_state", None) or getattr(
+        app, "score_state_round_start", None
+    )
+    if scores:
+        score_vp1 = scores.get(1, "")
+        score_vp2 = scores.get(2, "")
     else:
         score_vp1 = ""
         score_vp2 = ""
 
-    def _card_value(val: Any) -> Any:
-        return "" if val is None else val
-
-    row = {
-        "Session": app.session_id or "",
-        "Bedingung": block_condition,
-        "Block": block_number,
-        "Runde im Block": round_in_block,
-        "Spieler 1": spieler1_vp,
-        "VP": actor_vp,
-        "Karte1 VP1": _card_value(vp1_cards[0]) if vp1_cards else "",
-        "Karte2 VP1": _card_value(vp1_cards[1]) if vp1_cards else "",
-        "Karte1 VP2": _card_value(vp2_cards[0]) if vp2_cards else "",
-        "Karte2 VP2": _card_value(vp2_cards[1]) if vp2_cards else "",
-        "Aktion": action_label,
-        "Zeit": timestamp,
-        "Gewinner": winner_label,
-        "Punktestand VP1": score_vp1,
-        "Punktestand VP2": score_vp2,
-    }
-    buffer = getattr(app, "round_log_buffer", None)
-    if buffer is None:
-        buffer = []
-        app.round_log_buffer = buffer
-    fieldnames = getattr(app, "round_log_fieldnames", None)
-    if fieldnames is None:
-        fieldnames = list(ROUND_LOG_HEADER)
-        app.round_log_fieldnames = fieldnames
-    _extend_fieldnames(fieldnames, row)
-    buffer.append(row)
-    if not hasattr(app, "round_log_last_flush"):
-        app.round_log_last_flush = time.monotonic()
-    flush_round_log(app)
+    values = _build_row(
+        ctx.session_str,
+        block_condition,
+        block_number,
+        round_in_block,
+        spieler1_vp,
+        actor_vp,
+        vp1_cards,
+        vp2_cards,
+        action_label,
+        timestamp,
+        winner_label,
+        score_vp1,
+        score_vp2,
+    )
+    external = len(app.round_log_buffer)
+    if external != ctx.external_seen:
+        ctx.external_marks.append((len(ctx.columns[0]), external))
+        ctx.external_seen = external
+    for column, value in zip(ctx.columns, values):
+        column.append(value)
+    ctx.generation += 1
+    now = time.monotonic()
+    ctx.note_event(now)
+    # Same gate as flush_round_log, checked here to skip the call per event.
+    if (
+        _LOW_LATENCY_DISABLED
+        or ctx.pending() >= ctx.buffer_max
+        or now - app.round_log_last_flush >= ctx.flush_interval
+    ):
+        flush_round_log(app, force=True)
+
+
+def _build_row(
+    session: Any,
+    block_condition: Any,
+    block_number: Any,
+    round_in_block: Any,
+    spieler1_vp: str,
+    actor_vp: str,
+    vp1_cards: Sequence[Any],
+    vp2_cards: Sequence[Any],
+    action_label: str,
+    timestamp: str,
+    winner_label: str,
+    score_vp1: Any,
+    score_vp2: Any,
+) -> Tuple[Any, ...]:
+    """Assemble one round-log row (``ROUND_LOG_HEADER`` order) from already
+    resolved values (no app access)."""
+
+    c11, c12 = vp1_cards[0], vp1_cards[1]
+    c21, c22 = vp2_cards[0], vp2_cards[1]
+    return (
+        session,
+        block_condition,
+        block_number,
+        round_in_block,
+        spieler1_vp,
+        actor_vp,
+        "" if c11 is None else c11,
+        "" if c12 is None else c12,
+        "" if c21 is None else c21,
+        "" if c22 is None else c22,
+        action_label,
+        timestamp,
+        winner_label,
+        score_vp1,
+        score_vp2,
+    )
 
 
 def flush_round_log(
@@ -278,85 +598,142 @@ def flush_round_log(
     force: bool = False,
     wait: bool = False,
 ) -> None:
-    if not getattr(app, "round_log_path", None):
+    """Write buffered rows once the size/interval threshold is reached.
+
+    ``pandas_module`` is accepted for backwards compatibility and ignored;
+    rows are always written by the csv encoder.
+    """
+    if not getattr(app, "round_log_enabled", False):
         return
-    buffer: Optional[List[Dict[str, Any]]] = getattr(app, "round_log_buffer", None)
-    if not buffer:
+    buffer: Optional[List[Any]] = getattr(app, "round_log_buffer", None)
+    ctx: Optional[RoundLogContext] = getattr(app, "round_log_ctx", None)
+    if ctx is not None and ctx.generation == ctx.flushed_generation and not buffer:
+        # Nothing written since the last flush (close/shutdown hooks re-enter here).
+        return
+    columns = ctx.columns if ctx is not None else None
+    pending = (len(buffer) if buffer else 0) + (len(columns[0]) if columns else 0)
+    if not pending:
         return
 
     now = time.monotonic()
     last_flush = getattr(app, "round_log_last_flush", 0.0)
+    if ctx is not None:
+        buffer_max, flush_interval = ctx.buffer_max, ctx.flush_interval
+    else:
+        buffer_max, flush_interval = _ROUND_BUFFER_MAX, _ROUND_FLUSH_INTERVAL
     if (
         not force
         and not _LOW_LATENCY_DISABLED
-        and len(buffer) < _ROUND_BUFFER_MAX
-        and now - last_flush < _ROUND_FLUSH_INTERVAL
+        and pending < buffer_max
+        and now - last_flush < flush_interval
     ):
         return
 
     path = Path(app.round_log_path)
-    app.log_dir.mkdir(parents=True, exist_ok=True)
-    file_exists = path.exists() and path.stat().st_size > 0
-    rows = list(buffer)
-    buffer.clear()
+    if ctx is not None and ctx.path == path:
+        # Header state is tracked per session instead of stat'ing each flush;
+        # this also keeps queued-but-unwritten batches from adding a second header.
+        file_exists = ctx.header_written
+        ctx.header_written = True
+    else:
+        file_exists = path.exists() and path.stat().st_size > 0
+    # Hand the filled list over instead of copying it; the app (and its
+    # context) keep appending to a fresh one.
+    rows: List[Any] = []
+    if buffer:
+        rows = buffer
+        app.round_log_buffer = []
+        if ctx is not None:
+            ctx.buffer = app.round_log_buffer
     app.round_log_last_flush = now
     fieldnames = getattr(app, "round_log_fieldnames", None)
     if fieldnames is None:
         fieldnames = list(ROUND_LOG_HEADER)
     fieldnames = list(fieldnames)
 
-    dict_rows: List[Dict[str, Any]] = []
+    # Externally buffered rows (dicts or header-ordered sequences) are merged
+    # with the column buffer in arrival order; extra dict keys extend
+    # ``fieldnames``.
+    header_len = len(ROUND_LOG_HEADER)
     for entry in rows:
         if isinstance(entry, dict):
-            row_dict = dict(entry)
+            _extend_fieldnames(fieldnames, entry)
+    pad = [""] * (len(fieldnames) - header_len)
+    external_rows: List[Sequence[Any]] = []
+    for entry in rows:
+        if isinstance(entry, dict):
+            external_rows.append([entry.get(key, "") for key in fieldnames])
         else:
-            row_dict = _sequence_row_to_dict(entry)
-        _extend_fieldnames(fieldnames, row_dict)
-        dict_rows.append(row_dict)
+            values = list(entry[:header_len])
+            values.extend([""] * (header_len - len(values)))
+            external_rows.append(values + pad)
+    column_rows: List[Sequence[Any]] = []
+    if columns and columns[0]:
+        if pad:
+            column_rows = [list(row) + pad for row in zip(*columns)]
+        else:
+            column_rows = list(zip(*columns))
+        for column in columns:
+            column.clear()
+    value_rows = column_rows
+    if external_rows:
+        value_rows = []
+        col_pos = ext_pos = 0
+        for col_end, ext_end in ctx.external_marks if ctx is not None else ():
+            value_rows.extend(column_rows[col_pos:col_end])
+            value_rows.extend(external_rows[ext_pos:ext_end])
+            col_pos, ext_pos = col_end, ext_end
+        # Rows added after the last write_round_log call go last.
+        value_rows.extend(column_rows[col_pos:])
+        value_rows.extend(external_rows[ext_pos:])
+    if ctx is not None:
+        ctx.external_marks = []
+        ctx.external_seen = 0
+    if ctx is not None:
+        ctx.flushed_generation = ctx.generation
     app.round_log_fieldnames = fieldnames
+    if ctx is not None:
+        ctx.fieldnames = fieldnames
 
     if _LOW_LATENCY_DISABLED:
-        pd = pandas_module if pandas_module is not None else _pd
-        if pd is not None:
-            df = pd.DataFrame(dict_rows)
-            df = df.reindex(columns=fieldnames)
-            df.fillna("", inplace=True)
-            df.to_csv(
-                path,
-                mode="a",
-                header=not file_exists,
-                index=False,
-                columns=fieldnames,
-            )
-        else:
-            _write_round_rows(path, dict_rows, fieldnames, not file_exists)
+        _write_round_rows(path, value_rows, fieldnames, not file_exists)
         return
 
     queue_obj = _ensure_round_writer()
     write_header = not file_exists
     try:
-        queue_obj.put_nowait((path, dict_rows, fieldnames, write_header))
+        queue_obj.put_nowait((path, value_rows, fieldnames, write_header))
     except queue.Full:
-        log.warning(
-            "Round log queue saturated – falling back to synchronous flush (%d rows)",
-            len(rows),
-        )
-        _write_round_rows(path, dict_rows, fieldnames, write_header)
+        overflowed = queue_obj.put_overflow((path, value_rows, fieldnames, write_header))
+        if overflowed % 10 == 1:
+            log.warning(
+                "Round log queue saturated – %d batches deferred to overflow (%d rows)",
+                overflowed,
+                len(value_rows),
+            )
     else:
         if _PERF_LOGGING and queue_obj.maxsize:
             load = queue_obj.qsize() / queue_obj.maxsize
             if load >= 0.8:
                 log.warning("Round log queue at %.0f%% capacity", load * 100.0)
-        if wait:
-            queue_obj.join()
+    if wait:
+        queue_obj.join()
 
 
 def close_round_log(app: Any) -> None:
     flush_round_log(app, force=True, wait=not _LOW_LATENCY_DISABLED)
+    if _ROUND_QUEUE is not None and not _LOW_LATENCY_DISABLED:
+        # Earlier non-waiting flushes may still be queued even if the buffer is empty.
+        _ROUND_QUEUE.join()
+    path = getattr(app, "round_log_path", None)
+    if path:
+        _release_round_file(Path(path))
     if getattr(app, "round_log_fp", None):
         app.round_log_fp.close()
     app.round_log_fp = None
     app.round_log_writer = None
     if getattr(app, "round_log_path", None):
         app.round_log_path = None
+    app.round_log_enabled = False
+    app.round_log_ctx = None
     app.round_log_fieldnames = list(ROUND_LOG_HEADER)
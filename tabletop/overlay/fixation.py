@@ -2,26 +2,71 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
 import importlib
-import importlib.util
+import queue
 import time
 from pathlib import Path
 from typing import Any, Callable, Iterable, Optional
 
 import numpy as np
-import sounddevice as sd
 import threading
 
 _FIXATION_CROSS_ATTR = "_fixation_cross_overlay"
+_FIXATION_CROSS_LAST_ATTR = "_fixation_cross_last"
 
-_GRAPHICS_SPEC = importlib.util.find_spec("kivy.graphics")
-if _GRAPHICS_SPEC is not None:
-    _graphics = importlib.import_module("kivy.graphics")
-    _Color = getattr(_graphics, "Color", None)
-    _Line = getattr(_graphics, "Line", None)
-else:  # pragma: no cover - executed only when Kivy is unavailable
-    _Color = None
-    _Line = None
+# One long-lived output stream and worker replace the per-tone thread and
+# the stream open/close inside ``sd.play``.
+_AUDIO_QUEUE: "queue.Queue[tuple[Any, int, Any, Any]]" = queue.Queue()
+_AUDIO_WORKER: Optional[threading.Thread] = None
+_AUDIO_LOCK = threading.Lock()
+_AUDIO_STREAM: Any = None
+_AUDIO_STREAM_FS: Optional[int] = None
+
+# sounddevice (PortAudio device enumeration) and kivy.graphics are imported
+# on first use so importing this module stays cheap.
+_SD: Any = None
+_GRAPHICS: Optional[tuple[Any, Any]] = None
+
+
+def _sounddevice() -> Any:
+    global _SD
+    if _SD is None:
+        import sounddevice
+
+        _SD = sounddevice
+    return _SD
+
+
+def _graphics() -> tuple[Any, Any]:
+    """``(Color, Line)`` from ``kivy.graphics``; ``(None, None)`` without Kivy."""
+
+    global _GRAPHICS
+    if _GRAPHICS is None:
+        try:
+            graphics = importlib.import_module("kivy.graphics")
+        except ImportError:  # pragma: no cover - executed only when Kivy is unavailable
+            _GRAPHICS = (None, None)
+        else:
+            _GRAPHICS = (getattr(graphics, "Color", None), getattr(graphics, "Line", None))
+    return _GRAPHICS
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_tone(
+    sample_rate: int, duration: float, frequency: float, amplitude: float
+) -> np.ndarray:
+    # Phase in float64, samples in float32 (the usual device format), so
+    # PortAudio needs no conversion pass and half the bytes are moved.
+    # ``phase`` is transformed in place instead of allocating temporaries.
+    phase = np.arange(int(sample_rate * duration), dtype=np.float64)
+    phase *= 2 * np.pi * frequency / sample_rate
+    np.sin(phase, out=phase)
+    phase *= amplitude
+    tone = phase.astype(np.float32)
+    tone.setflags(write=False)
+    return tone
 
 
 def generate_fixation_tone(
@@ -29,40 +74,133 @@ def generate_fixation_tone(
     duration: float = 0.2,
     frequency: float = 1000.0,
     amplitude: float = 0.9,
+    *,
+    writable: bool = False,
 ):
-    """Create the sine-wave tone that is played during the fixation sequence."""
+    """Create the sine-wave tone that is played during the fixation sequence.
+
+    Tones are cached per parameter set and returned read-only; pass
+    ``writable=True`` for a private, mutable copy.
+    """
+
+    tone = _cached_tone(sample_rate, duration, frequency, amplitude)
+    return tone.copy() if writable else tone
+
+
+def _output_stream(sample_rate: int) -> Any:
+    """Return the persistent output stream, (re)opening it for ``sample_rate``."""
+
+    global _AUDIO_STREAM, _AUDIO_STREAM_FS
+    if _AUDIO_STREAM is not None and _AUDIO_STREAM_FS == sample_rate:
+        return _AUDIO_STREAM
+    _close_output_stream()
+    stream = _sounddevice().OutputStream(
+        samplerate=sample_rate,
+        channels=1,
+        dtype="float32",
+        blocksize=256,
+        latency="low",
+    )
+    stream.start()
+    _AUDIO_STREAM = stream
+    _AUDIO_STREAM_FS = sample_rate
+    return stream
+
+
+def _close_output_stream() -> None:
+    global _AUDIO_STREAM, _AUDIO_STREAM_FS
+    stream, _AUDIO_STREAM, _AUDIO_STREAM_FS = _AUDIO_STREAM, None, None
+    if stream is None:
+        return
+    try:
+        stream.stop()
+        stream.close()
+    except Exception:  # pragma: no cover - audio hardware dependent
+        pass
 
-    t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-    return amplitude * np.sin(2 * np.pi * frequency * t)
 
+atexit.register(_close_output_stream)
 
-def play_fixation_tone(controller: Any) -> None:
-    """Play the fixation tone asynchronously using sounddevice."""
 
-    tone = getattr(controller, "fixation_tone", None)
-    if tone is None:
-        return
-
-    sample_rate = getattr(controller, "fixation_tone_fs", 44100)
-    tone_data = tone.copy()
-    beep_callback = getattr(controller, "fixation_beep_callback", None)
-
-    def _play():
+def _audio_worker() -> None:
+    while True:
+        tone, sample_rate, beep_callback, controller = _AUDIO_QUEUE.get()
         try:
-            sd.play(tone_data, sample_rate)
+            try:
+                stream = _output_stream(sample_rate)
+            except Exception as exc:  # pragma: no cover - audio hardware dependent
+                print(f"Warnung: Audiostream nicht verfügbar, nutze sd.play: {exc}")
+                stream = None
             if callable(beep_callback):
                 try:
                     beep_callback()
                 except Exception:  # pragma: no cover - defensive callback guard
                     pass
-            sd.wait()
+            if stream is not None:
+                stream.write(np.ascontiguousarray(tone, dtype=np.float32))
+            else:
+                sd = _sounddevice()
+                sd.play(tone, sample_rate)
+                sd.wait()
         except Exception as exc:  # pragma: no cover - audio hardware dependent
             print(f"Warnung: Ton konnte nicht abgespielt werden: {exc}")
         finally:
             if hasattr(controller, "fixation_beep_callback"):
                 controller.fixation_beep_callback = None
 
-    threading.Thread(target=_play, daemon=True).start()
+
+def _ensure_audio_worker() -> None:
+    global _AUDIO_WORKER
+    if _AUDIO_WORKER is not None:
+        return
+    with _AUDIO_LOCK:
+        if _AUDIO_WORKER is None:
+            worker = threading.Thread(
+                target=_audio_worker, name="fixation-audio", daemon=True
+            )
+            worker.start()
+            _AUDIO_WORKER = worker
+
+
+_PREWARM_SILENCE = np.zeros(64, dtype=np.float32)
+_PREWARM_SILENCE.setflags(write=False)
+
+
+def prewarm_audio(sample_rate: int = 44100) -> None:
+    """Open the shared output stream ahead of the first tone.
+
+    Runs on the audio worker (non-blocking for the caller) and writes a short
+    silent buffer so PortAudio's cold start does not delay the first beep.
+    """
+
+    _ensure_audio_worker()
+    _AUDIO_QUEUE.put((_PREWARM_SILENCE, sample_rate, None, None))
+
+
+def play_fixation_tone(controller: Any) -> None:
+    """Play the fixation tone asynchronously on the shared output stream."""
+
+    tone = getattr(controller, "fixation_tone", None)
+    if tone is None:
+        return
+
+    sample_rate = getattr(controller, "fixation_tone_fs", 44100)
+    beep_callback = getattr(controller, "fixation_beep_callback", None)
+    # sounddevice only reads the buffer, so the (read-only) cached tone is passed as is.
+    _ensure_audio_worker()
+    _AUDIO_QUEUE.put((tone, sample_rate, beep_callback, controller))
+
+
+def _widget_is_alive(widget: Any) -> bool:
+    """False for ``None`` and for Kivy WeakProxy objects that were released."""
+
+    if widget is None:
+        return False
+    try:
+        _ = widget.opacity
+    except ReferenceError:
+        return False
+    return True
 
 
 def run_fixation_sequence(
@@ -83,7 +221,8 @@ def run_fixation_sequence(
 
     overlay = getattr(controller, "fixation_overlay", None)
     image = getattr(controller, "fixation_image", None)
-    if overlay is None or image is None:
+    # Released widgets (screen already gone): complete at once, no Clock events.
+    if not (_widget_is_alive(overlay) and _widget_is_alive(image)):
         if hasattr(controller, "fixation_required"):
             controller.fixation_required = False
         if on_complete:
@@ -173,14 +312,19 @@ def run_fixation_sequence(
     schedule_once(show_stop_and_tone, 5)
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_source(path_str: str) -> str:
+    """Existence check per image path; call ``_resolve_source.cache_clear()``
+    when assets change on disk."""
+
+    candidate = Path(path_str)
+    return str(candidate) if candidate.exists() else ""
+
+
 def _path_to_source(image_path: Optional[Path | str]) -> str:
     if image_path is None:
         return ""
-    if isinstance(image_path, Path):
-        candidate = image_path
-    else:
-        candidate = Path(image_path)
-    return str(candidate) if candidate.exists() else ""
+    return _resolve_source(str(image_path))
 
 
 def _set_image_source(image: Any, image_path: Optional[Path | str], *, fallback: str) -> None:
@@ -198,13 +342,14 @@ def _set_image_source(image: Any, image_path: Optional[Path | str], *, fallback:
 
 
 def _ensure_cross_overlay(image: Any) -> None:
-    if _Color is None or _Line is None:
+    Color, Line = _graphics()
+    if Color is None or Line is None:
         return
     if getattr(image, _FIXATION_CROSS_ATTR, None) is None:
         with image.canvas.after:
-            color = _Color(1, 1, 1, 1)
-            line1 = _Line(points=[], width=2, cap="square")
-            line2 = _Line(points=[], width=2, cap="square")
+            color = Color(1, 1, 1, 1)
+            line1 = Line(points=[], width=2, cap="square")
+            line2 = Line(points=[], width=2, cap="square")
         image.bind(size=_update_cross_overlay, pos=_update_cross_overlay)
         setattr(image, _FIXATION_CROSS_ATTR, (color, line1, line2))
     _update_cross_overlay(image)
@@ -221,33 +366,44 @@ def _remove_cross_overlay(image: Any) -> None:
         if instruction in canvas.children:
             canvas.remove(instruction)
     delattr(image, _FIXATION_CROSS_ATTR)
+    setattr(image, _FIXATION_CROSS_LAST_ATTR, None)
 
 
 def _update_cross_overlay(image: Any, *_: Any) -> None:
     cross = getattr(image, _FIXATION_CROSS_ATTR, None)
     if not cross:
         return
-    _, line1, line2 = cross
     width, height = image.size
+    x, y = image.x, image.y
+    # size and pos both fire on every layout pass; only redraw on real changes.
+    geometry = (x, y, width, height)
+    if getattr(image, _FIXATION_CROSS_LAST_ATTR, None) == geometry:
+        return
+    setattr(image, _FIXATION_CROSS_LAST_ATTR, geometry)
+
+    _, line1, line2 = cross
     if width <= 0 or height <= 0:
         line1.points = []
         line2.points = []
         return
 
-    margin = min(width, height) * 0.2
-    x1 = image.x + margin
-    x2 = image.x + width - margin
-    y1 = image.y + margin
-    y2 = image.y + height - margin
+    side = min(width, height)
+    margin = side * 0.2
+    x1 = x + margin
+    x2 = x + width - margin
+    y1 = y + margin
+    y2 = y + height - margin
     line1.points = [x1, y1, x2, y2]
     line2.points = [x1, y2, x2, y1]
-    stroke = max(min(width, height) * 0.05, 2.0)
-    line1.width = stroke
-    line2.width = stroke
+    stroke = max(side * 0.05, 2.0)
+    if line1.width != stroke:
+        line1.width = stroke
+        line2.width = stroke
 
 
 __all__ = [
     "generate_fixation_tone",
     "play_fixation_tone",
+    "prewarm_audio",
     "run_fixation_sequence",
 ]
@@ -35,6 +35,7 @@ from tabletop.logging.round_csv import (
 from tabletop.overlay.fixation import (
     generate_fixation_tone,
     play_fixation_tone as overlay_play_fixation_tone,
+    prewarm_audio,
     run_fixation_sequence as overlay_run_fixation_sequence,
 )
 from tabletop.overlay.process import start_overlay_process, stop_overlay_process
@@ -174,6 +175,7 @@ class TabletopRoot(FloatLayout):
         self.session_popup = None
         self.session_configured = False
         self.round_log_path = None
+        self.round_log_enabled = False
         self.round_log_fp = None
         self.round_log_writer = None
         self.round_log_buffer = []
@@ -300,6 +302,8 @@ class TabletopRoot(FloatLayout):
         self.et_clients = {"p1": p1, "p2": p2}
         self.et_bridge = ETMarkerBridge(p1, p2)
         # ETStorage nutzt dasselbe DB-File; optional CSV ins Log-Verzeichnis
+        if self.et_storage is not None:
+            self.et_storage.close()
         self.et_storage = ETStorage(str(db_path), csv_dir=str(self.log_dir))
         self.start_gaze_streams()
         init_round_log(self)
@@ -490,6 +494,9 @@ class TabletopRoot(FloatLayout):
         self.next_block_preview = None
         self.fixation_tone_fs = 44100
         self.fixation_tone = self.fixation_tone_factory(self.fixation_tone_fs)
+        if self.fixation_player is overlay_play_fixation_tone:
+            # Audio-Stream vorab öffnen, damit der erste Ton nicht verzögert startet
+            prewarm_audio(self.fixation_tone_fs)
         self._update_scale()
         self.update_user_displays()
         self.update_intro_overlay()
@@ -1556,7 +1563,7 @@ class TabletopRoot(FloatLayout):
     def start_gaze_streams(self) -> None:
         if not self.et_storage:
             return
-        from et.gaze_stream import GazeStream, GazeSample
+        from et.gaze_stream import GazeBatch, GazeStream
 
         try:
             asyncio.get_running_loop()
@@ -1566,20 +1573,24 @@ class TabletopRoot(FloatLayout):
         clients = getattr(self, "et_clients", {})
         self._gaze_streams = []
 
-        def on_sample(s: GazeSample):
+        def on_batch(batch: GazeBatch):
             try:
-                row = (
-                    self.session_id,
-                    s.player,
-                    float(s.x),
-                    float(s.y),
-                    (None if s.conf is None else float(s.conf)),
-                    int(s.t_device_ns),
-                    int(s.t_host_ns),
-                    int(time.perf_counter_ns()),
-                    datetime.now(timezone.utc).isoformat(),
+                xs, ys, confs, t_dev, t_host = batch.columns()
+                n = len(xs)
+                rows = list(
+                    zip(
+                        itertools.repeat(self.session_id, n),
+                        itertools.repeat(batch.player, n),
+                        xs,
+                        ys,
+                        confs,
+                        t_dev,
+                        t_host,
+                        itertools.repeat(int(time.perf_counter_ns()), n),
+                        itertools.repeat(datetime.now(timezone.utc).isoformat(), n),
+                    )
                 )
-                self.et_storage.write_gaze([row])
+                self.et_storage.write_gaze(rows)
             except Exception:
                 pass
 
@@ -1587,7 +1598,7 @@ class TabletopRoot(FloatLayout):
             cli = clients.get(key)
             if not cli:
                 continue
-            gs = GazeStream(key, cli.endpoint, on_sample)
+            gs = GazeStream(key, cli.endpoint, on_batch=on_batch)
             gs.start()
             self._gaze_streams.append(gs)
 
@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
-import threading
 import time
-from typing import Dict
+from collections import OrderedDict
 
 __all__ = ["Debouncer"]
 
 
 class Debouncer:
-    """Return False when events fire faster than the configured interval."""
+    """Return False when events fire faster than the configured interval.
 
-    def __init__(self, interval_ms: float = 50.0) -> None:
+    No lock is taken: each dict operation is atomic under the GIL, and the
+    read-modify-write race between threads can at most let one extra event
+    for the same key through, which is acceptable for input debouncing.
+    At most ``max_keys`` keys are remembered; the least recently used key is
+    evicted first so per-widget keys cannot grow the table without bound.
+    """
+
+    def __init__(self, interval_ms: float = 50.0, *, max_keys: int = 4096) -> None:
         self._interval = max(0.0, float(interval_ms)) / 1000.0
-        self._last: Dict[str, float] = {}
-        self._lock = threading.Lock()
+        self._max_keys = max(1, int(max_keys))
+        self._last: OrderedDict[str, float] = OrderedDict()
 
     def allow(self, key: str, interval_override_ms: float | None = None) -> bool:
         """Return True only if the previous event is outside the interval."""
@@ -24,9 +30,22 @@ class Debouncer:
         interval = self._interval
         if interval_override_ms is not None:
             interval = max(0.0, float(interval_override_ms)) / 1000.0
-        with self._lock:
-            last = self._last.get(key)
-            if last is None or now - last >= interval:
-                self._last[key] = now
-                return True
+        table = self._last
+        last = table.get(key)
+        if last is None:
+            table[key] = now
+            if len(table) > self._max_keys:
+                try:
+                    table.popitem(last=False)
+                except KeyError:
+                    pass
+            return True
+        try:
+            table.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread in between; treat as a fresh key.
+            pass
+        if now - last < interval:
             return False
+        table[key] = now
+        return True
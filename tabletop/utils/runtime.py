@@ -3,41 +3,52 @@
 from __future__ import annotations
 
 import os
+from typing import Optional
 
 _LOW_LATENCY_ENVS = ("LOW_LATENCY_DISABLED", "LOW_LATENCY_OFF")
 _PERF_ENVS = ("PERF_LOGGING", "TABLETOP_PERF")
 _BATCH_WINDOW_ENV = "EVENT_BATCH_WINDOW_MS"
 _BATCH_SIZE_ENV = "EVENT_BATCH_SIZE"
+_LOG_FLUSH_ENV = "EVENT_LOG_FLUSH_MS"
+_LOG_BATCH_SIZE_ENV = "EVENT_LOG_BATCH_SIZE"
+
+# Toggles are read from the environment once; see :func:`reset_runtime_cache`.
+_LOW_LATENCY_DISABLED: Optional[bool] = None
+_PERF_LOGGING: Optional[bool] = None
+
+
+def _env_flag(names: tuple[str, ...]) -> bool:
+    return any(os.environ.get(env, "").strip() == "1" for env in names)
 
 
 def is_low_latency_disabled() -> bool:
     """Return ``True`` when the low-latency pipeline is disabled."""
 
-    for env in _LOW_LATENCY_ENVS:
-        if os.environ.get(env, "").strip() == "1":
-            return True
-    return False
+    global _LOW_LATENCY_DISABLED
+    if _LOW_LATENCY_DISABLED is None:
+        _LOW_LATENCY_DISABLED = _env_flag(_LOW_LATENCY_ENVS)
+    return _LOW_LATENCY_DISABLED
 
 
 def is_perf_logging_enabled() -> bool:
     """Return whether verbose performance logging is requested."""
 
-    if is_low_latency_disabled():
-        return False
-    for env in _PERF_ENVS:
-        if os.environ.get(env, "").strip() == "1":
-            return True
-    return False
+    global _PERF_LOGGING
+    if _PERF_LOGGING is None:
+        _PERF_LOGGING = not is_low_latency_disabled() and _env_flag(_PERF_ENVS)
+    return _PERF_LOGGING
 
 
-def event_batch_window_override(default_seconds: float) -> float:
-    """Return the batch window in seconds.
+def reset_runtime_cache() -> None:
+    """Forget cached toggles so the next call re-reads the environment (tests)."""
+
+    global _LOW_LATENCY_DISABLED, _PERF_LOGGING
+    _LOW_LATENCY_DISABLED = None
+    _PERF_LOGGING = None
 
-    The value can be overridden by :envvar:`EVENT_BATCH_WINDOW_MS`.
-    Invalid inputs fall back to ``default_seconds``.
-    """
 
-    raw = os.environ.get(_BATCH_WINDOW_ENV)
+def _millis_override(env: str, default_seconds: float) -> float:
+    raw = os.environ.get(env)
     if not raw:
         return default_seconds
     try:
@@ -47,10 +58,8 @@ def event_batch_window_override(default_seconds: float) -> float:
     return max(0.0, millis / 1000.0)
 
 
-def event_batch_size_override(default_size: int) -> int:
-    """Return the batch size honouring :envvar:`EVENT_BATCH_SIZE`."""
-
-    raw = os.environ.get(_BATCH_SIZE_ENV)
+def _size_override(env: str, default_size: int) -> int:
+    raw = os.environ.get(env)
     if not raw:
         return default_size
     try:
@@ -60,9 +69,44 @@ def event_batch_size_override(default_size: int) -> int:
     return max(1, value)
 
 
+def event_batch_window_override(default_seconds: float) -> float:
+    """Return the batch window in seconds.
+
+    The value can be overridden by :envvar:`EVENT_BATCH_WINDOW_MS`.
+    Invalid inputs fall back to ``default_seconds``.
+    """
+
+    return _millis_override(_BATCH_WINDOW_ENV, default_seconds)
+
+
+def event_batch_size_override(default_size: int) -> int:
+    """Return the batch size honouring :envvar:`EVENT_BATCH_SIZE`."""
+
+    return _size_override(_BATCH_SIZE_ENV, default_size)
+
+
+def event_log_flush_interval_override(default_seconds: float) -> float:
+    """Return the SQLite event-log flush interval in seconds.
+
+    The value can be overridden by :envvar:`EVENT_LOG_FLUSH_MS`; it is
+    independent of the marker dispatch window.
+    """
+
+    return _millis_override(_LOG_FLUSH_ENV, default_seconds)
+
+
+def event_log_batch_size_override(default_size: int) -> int:
+    """Return the event-log batch size honouring :envvar:`EVENT_LOG_BATCH_SIZE`."""
+
+    return _size_override(_LOG_BATCH_SIZE_ENV, default_size)
+
+
 __all__ = [
     "is_low_latency_disabled",
     "is_perf_logging_enabled",
+    "reset_runtime_cache",
     "event_batch_size_override",
     "event_batch_window_override",
+    "event_log_batch_size_override",
+    "event_log_flush_interval_override",
 ]
@@ -0,0 +1,30 @@
+import asyncio
+
+from et import gaze_stream
+from et.gaze_stream import GazeStream
+from et.neon_client import NeonEndpoint
+
+
+def test_gaze_stream_delivers_batches(monkeypatch):
+    async def fake_batches(cfg):
+        yield [(0.1 * i, 0.2, 0.9, 1000 + i) for i in range(3)]
+        yield [(0.4, 0.2, 0.9, 1003), (None, None, None, None), (0.5, 0.2, 0.9, 1004)]
+
+    monkeypatch.setattr(gaze_stream, "neon_gaze_field_batches", fake_batches)
+    batches = []
+    gs = GazeStream("p1", NeonEndpoint("localhost"), on_batch=lambda b: batches.append(list(b)), batch_size=2, batch_interval_s=60.0)
+    asyncio.run(gs._run())
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [s.t_device_ns for b in batches for s in b] == [1000, 1001, 1002, 1003, 1004]
+
+
+def test_gaze_ring_columns_map_missing_conf_to_none():
+    from et.gaze_stream import GazeRing
+
+    ring = GazeRing("p2", capacity=4)
+    ring.append(0.1, 0.2, None, 1, 2)
+    ring.append(0.3, 0.4, 0.5, 3, 4)
+    batch = ring.take()
+    assert batch.columns() == ([0.1, 0.3], [0.2, 0.4], [None, 0.5], [1, 3], [2, 4])
+    assert batch[0].conf is None and batch[-1].t_host_ns == 4
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from et.neon_client import NeonClient, NeonEndpoint, NeonError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        self.server.paths.append(self.path)
+        self.server.bodies.append((time.perf_counter(), json.loads(body or b"{}")))
+        time.sleep(self.server.delay_s)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+        if self.server.close_after:
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.paths = []
+    srv.bodies = []
+    srv.delay_s = 0.0
+    srv.close_after = False
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _client(srv) -> NeonClient:
+    client = NeonClient(NeonEndpoint("127.0.0.1", srv.server_address[1]))
+    client._timeout_s = 0.2
+    return client
+
+
+def test_request_not_repeated_after_timeout(server):
+    client = _client(server)
+    asyncio.run(client.recording_stop())
+    server.delay_s = 0.5
+    with pytest.raises(NeonError):
+        asyncio.run(client.recording_start())
+    time.sleep(0.6)
+    assert server.paths == ["/recording:stop", "/recording:start"]
+    client.close()
+
+
+def test_request_retried_on_stale_connection(server):
+    # Gerät schließt die Keep-Alive-Verbindung ohne "Connection: close"
+    server.close_after = True
+    client = _client(server)
+    asyncio.run(client.recording_stop())
+    assert client._conn is not None
+    time.sleep(0.05)
+    asyncio.run(client.recording_start())
+    assert server.paths == ["/recording:stop", "/recording:start"]
+    client.close()
+
+
+def test_marker_sent_immediately_and_individually(server):
+    client = _client(server)
+    sent = time.perf_counter()
+    client.send_marker("fix.flash_start")
+    deadline = time.monotonic() + 1.0
+    while not server.bodies and time.monotonic() < deadline:
+        time.sleep(0.0005)
+    assert server.bodies
+    arrived, payload = server.bodies[0]
+    assert arrived - sent < 0.005
+    assert payload == {"name": "fix.flash_start", "ts_unix_ns": None, "kv": {}}
+
+    client.send_marker("sync.a")
+    client.send_marker("sync.b", t_host_ns=5, kv={"k": 1})
+    # close() sendet noch eingereihte Marker, bevor der Thread endet
+    client.close()
+    assert server.paths == ["/marker", "/marker", "/marker"]
+    assert [p["name"] for _, p in server.bodies] == ["fix.flash_start", "sync.a", "sync.b"]
+    assert server.bodies[2][1] == {"name": "sync.b", "ts_unix_ns": 5, "kv": {"k": 1}}
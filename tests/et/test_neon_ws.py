@@ -0,0 +1,33 @@
+from et.neon_client import NeonEndpoint
+from et.neon_ws import NeonWSConfig, extract_gaze_fields
+
+
+def test_extract_gaze_fields_flat_frame():
+    frame = b'{"x": 0.25, "y": 0.75, "confidence": 0.9, "timestamp_unix_ns": 1700000000000000000}'
+    assert extract_gaze_fields(frame) == (0.25, 0.75, 0.9, 1700000000000000000)
+
+
+def test_extract_gaze_fields_falls_back_on_schema_drift():
+    frame = '{"topic": "gaze", "data": {"norm_pos": {"x": 0.1, "y": 0.2}, "conf": 1}}'
+    assert extract_gaze_fields(frame) == (0.1, 0.2, 1.0, None)
+    assert extract_gaze_fields(b"not json") == (None, None, None, None)
+
+
+def test_extract_gaze_fields_learns_schema():
+    cfg = NeonWSConfig(NeonEndpoint("localhost"))
+    assert extract_gaze_fields(b'{"gx": 0.3, "gy": 0.4, "conf": 0.5, "ts": 7}', cfg) == (0.3, 0.4, 0.5, 7)
+    assert cfg.schema_parser is not None
+    assert extract_gaze_fields(b'{"gx": 0.6, "gy": 0.7, "conf": 0.8, "ts": 8}', cfg) == (0.6, 0.7, 0.8, 8)
+    # Schema-Wechsel: zurück auf den generischen Parser
+    assert extract_gaze_fields(b'{"norm_pos": {"x": 0.1, "y": 0.2}}', cfg) == (0.1, 0.2, None, None)
+
+
+def test_extract_gaze_fields_ignores_nested_keys():
+    frame = b'{"gaze": {"x": 5}, "x": 0.1, "y": 0.2, "confidence": 1, "timestamp_unix_ns": 9}'
+    assert extract_gaze_fields(frame) == (0.1, 0.2, 1.0, 9)
+
+
+def test_extract_gaze_fields_prefers_device_time():
+    frame = b'{"x": 0.1, "y": 0.2, "confidence": 1, "timestamp_unix_ns": 9, "device_time_ns": 3}'
+    assert extract_gaze_fields(frame) == (0.1, 0.2, 1.0, 3)
+    assert extract_gaze_fields(frame.decode()) == (0.1, 0.2, 1.0, 3)
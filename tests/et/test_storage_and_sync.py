@@ -1,6 +1,8 @@
+import gc
 import os
 import sqlite3
 import tempfile
+import weakref
 import asyncio
 
 from et.storage import ETStorage
@@ -13,12 +15,37 @@ def test_etstorage_creates_tables_and_inserts():
         st = ETStorage(db, csv_dir=d)
         st.write_gaze([("s1", "p1", 0.5, 0.5, 1.0, 10, 20, 30, "2025-01-01T00:00:00Z")])
         st.write_sync([("s1", "p1", "fix.flash_start", 20, 10, -10, "2025-01-01T00:00:00Z")])
+        st.flush()
         conn = sqlite3.connect(db)
         c = conn.cursor()
         c.execute("SELECT COUNT(*) FROM gaze_samples")
         assert c.fetchone()[0] == 1
         c.execute("SELECT COUNT(*) FROM sync_pairs")
         assert c.fetchone()[0] == 1
+        conn.close()
+        st.close()
+
+
+def test_etstorage_enqueues_batches_and_is_released_on_close():
+    with tempfile.TemporaryDirectory() as d:
+        db = os.path.join(d, "events_test.sqlite3")
+        st = ETStorage(db)
+        puts = []
+        put = st._queue.put_nowait
+        st._queue.put_nowait = lambda item: (puts.append(item), put(item))
+        rows = [("s1", "p1", 0.5, 0.5, 1.0, i, i, i, "") for i in range(64)]
+        st.write_gaze(rows)
+        assert len(puts) == 1
+        st.flush()
+        conn = sqlite3.connect(db)
+        assert conn.execute("SELECT COUNT(*) FROM gaze_samples").fetchone()[0] == 64
+        conn.close()
+        st.close()
+        # nach close() hält auch atexit die Instanz nicht mehr fest
+        ref = weakref.ref(st)
+        del st, put
+        gc.collect()
+        assert ref() is None
 
 
 def test_neon_time_sync_uses_measure_fn():
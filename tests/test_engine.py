@@ -0,0 +1,114 @@
+import csv
+import io
+
+import pytest
+
+from tabletop.engine import (
+    GameEngine,
+    GameEngineConfig,
+    Phase,
+    Player,
+    RoundSchedule,
+    _row_to_bytes,
+)
+
+_HEADER = ["Runde", "VP1 K1", "VP1 K2", "", "", "", "", "VP2 K1", "VP2 K2", "", ""]
+
+
+def _write_schedule(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as fp:
+        csv.writer(fp).writerows(rows)
+    return str(path)
+
+
+def _round(a, b, c, d):
+    return ["1", str(a), str(b), "", "", "", "", str(c), str(d), "", ""]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    csv_path = _write_schedule(tmp_path / "paare.csv", [_HEADER, _round(3, 4, 5, 6), _round(7, 8, 9, 10)])
+    eng = GameEngine(
+        GameEngineConfig(
+            session_id="S1",
+            csv_path=csv_path,
+            db_path=str(tmp_path / "events.sqlite3"),
+            log_dir=str(tmp_path),
+        )
+    )
+    yield eng
+    eng.close()
+
+
+def test_reveal_order_and_messages(engine):
+    engine.click_start(Player.P1)
+    engine.click_start(Player.P2)
+    assert engine.current.phase == Phase.DEALING
+
+    steps = [
+        (Player.P1, 0, "Zuerst: Spieler 1, Karte 1."),
+        (Player.P2, 0, "Zweitens: Spieler 2, Karte 1."),
+        (Player.P1, 1, "Drittens: Spieler 1, Karte 2."),
+        (Player.P2, 1, "Viertens: Spieler 2, Karte 2."),
+    ]
+    revealed = []
+    for player, idx, message in steps:
+        for wrong_player in Player:
+            for wrong_idx in (0, 1):
+                if (wrong_player, wrong_idx) == (player, idx):
+                    continue
+                with pytest.raises(RuntimeError, match=message):
+                    engine.click_reveal_card(wrong_player, wrong_idx)
+        engine.click_reveal_card(player, idx)
+        revealed.append((player, idx))
+        state = engine.get_public_state()
+        assert state["p1_revealed"] == tuple((Player.P1, i) in revealed for i in (0, 1))
+        assert state["p2_revealed"] == tuple((Player.P2, i) in revealed for i in (0, 1))
+
+    assert engine.current.phase == Phase.SIGNAL_WAIT
+    with pytest.raises(RuntimeError, match="Falsche Phase"):
+        engine.click_reveal_card(Player.P1, 0)
+
+
+def test_reveal_rejects_invalid_card_index(engine):
+    engine.click_start(Player.P1)
+    engine.click_start(Player.P2)
+    with pytest.raises(ValueError):
+        engine.click_reveal_card(Player.P1, 2)
+    assert engine.current.vis.reveal_step == 0
+
+
+def test_schedule_skips_header_row(tmp_path):
+    path = _write_schedule(tmp_path / "h.csv", [_HEADER, _round(3, 4, 5, 6), [], ["", " "], _round(7, 8, 9, 10)])
+    schedule = RoundSchedule(path)
+    assert [(r.vp1_cards, r.vp2_cards) for r in schedule.rounds] == [((3, 4), (5, 6)), ((7, 8), (9, 10))]
+    assert schedule.cards_for(1) == (7, 8, 9, 10)
+
+
+def test_schedule_without_header_keeps_first_row(tmp_path):
+    first = ["1", " 3 ", "x", "4", "", "", "", "5", "", "6", ""]
+    path = _write_schedule(tmp_path / "n.csv", [first, _round(7, 8, 9, 10)])
+    schedule = RoundSchedule(path)
+    assert schedule.cards_for(0) == (3, 4, 5, 6)
+    assert len(schedule.rounds) == 2
+
+
+def test_schedule_errors(tmp_path):
+    with pytest.raises(ValueError, match="Keine Runden"):
+        RoundSchedule(_write_schedule(tmp_path / "empty.csv", [_HEADER]))
+    with pytest.raises(ValueError, match="Zu wenige Karten"):
+        RoundSchedule(_write_schedule(tmp_path / "short.csv", [_round(3, 4, 5, 6), ["1", "3"]]))
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        ["S1", 1, "no_pay", 2, "P1", "VP1", 3, 4, 5, 6, "Signal", "2025-01-01T00:00:00Z", "", 0, 0],
+        ["a,b", 'sagt "hoch"', "zeile\nzwei", "cr\rx", None, "", 1.5],
+        ["", None, ""],
+    ],
+)
+def test_row_to_bytes_matches_csv_writer(row):
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerow(row)
+    assert _row_to_bytes(row) == buf.getvalue().encode("utf-8")
@@ -0,0 +1,41 @@
+import os
+import sqlite3
+import tempfile
+
+from tabletop.engine import EventLogger, Phase
+
+
+def test_event_logger_writes_all_rows_on_close():
+    with tempfile.TemporaryDirectory() as d:
+        db = os.path.join(d, "events.sqlite3")
+        csv_path = os.path.join(d, "events.csv")
+        logger = EventLogger(db, csv_path)
+        for i in range(1200):
+            logger.log("s1", 1, Phase.WAITING_START, "P1", "tap", {"i": i})
+        logger.close()
+
+        conn = sqlite3.connect(db)
+        assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 1200
+        conn.close()
+        with open(csv_path, encoding="utf-8") as fp:
+            assert sum(1 for _ in fp) == 1200
+
+
+def test_event_logger_csv_export_covers_only_own_rows():
+    with tempfile.TemporaryDirectory() as d:
+        db = os.path.join(d, "events.sqlite3")
+        first = EventLogger(db)
+        first.log("s0", 1, Phase.WAITING_START, "P1", "tap", {})
+        first.close()
+
+        csv_path = os.path.join(d, "events.csv")
+        logger = EventLogger(db, csv_path)
+        for i in range(3):
+            logger.log("s1", 1, Phase.DEALING, "P2", "tap", {"i": i})
+        assert not os.path.exists(csv_path)
+        logger.close()
+
+        with open(csv_path, encoding="utf-8") as fp:
+            lines = fp.read().splitlines()
+        assert len(lines) == 3
+        assert all(line.startswith("s1,1,DEALING,P2,tap,") for line in lines)
@@ -0,0 +1,65 @@
+import csv
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from tabletop.logging import round_csv
+
+
+def _app(log_dir: Path) -> SimpleNamespace:
+    return SimpleNamespace(
+        session_id="S1",
+        log_dir=log_dir,
+        round_log_buffer=[],
+        current_block_info={"index": 1},
+        current_round_has_stake=True,
+        round_in_block=2,
+        next_block_preview=None,
+        role_by_physical={1: 2, 2: 1},
+        first_player=1,
+        score_state={1: 3, 2: 0},
+        score_state_round_start=None,
+        get_current_plan=lambda: (0, {"vp1": (4, 5), "vp2": (9, 10)}),
+        format_signal_choice=lambda level: level,
+        format_decision_choice=lambda decision: decision,
+    )
+
+
+def test_round_log_writes_header_once_across_flushes():
+    with tempfile.TemporaryDirectory() as d:
+        app = _app(Path(d))
+        round_csv.init_round_log(app)
+        for _ in range(5):
+            round_csv.write_round_log(app, "P1", "reveal_inner", {}, 1)
+            round_csv.flush_round_log(app, force=True)
+        round_csv.close_round_log(app)
+
+        with open(Path(d) / "round_log_S1.csv", encoding="utf-8", newline="") as fp:
+            rows = list(csv.reader(fp))
+        assert rows[0] == round_csv.ROUND_LOG_HEADER
+        assert len(rows) == 6
+        assert rows[1][:11] == ["S1", "pay", "1", "2", "VP2", "VP2", "4", "5", "9", "10", "Karte 1"]
+
+
+def test_round_log_keeps_arrival_order_with_external_rows():
+    with tempfile.TemporaryDirectory() as d:
+        app = _app(Path(d))
+        round_csv.init_round_log(app)
+        app.round_log_buffer.append({"Aktion": "extern 1"})
+        round_csv.write_round_log(app, "P1", "reveal_inner", {}, 1)
+        round_csv.write_round_log(app, "P1", "reveal_outer", {}, 1)
+        app.round_log_buffer.append({"Aktion": "extern 2"})
+        round_csv.write_round_log(app, "P1", "showdown", {}, 1)
+        app.round_log_buffer.append({"Aktion": "extern 3"})
+        round_csv.close_round_log(app)
+
+        with open(Path(d) / "round_log_S1.csv", encoding="utf-8", newline="") as fp:
+            rows = list(csv.DictReader(fp))
+        assert [row["Aktion"] for row in rows] == [
+            "extern 1",
+            "Karte 1",
+            "Karte 2",
+            "extern 2",
+            "Showdown",
+            "extern 3",
+        ]
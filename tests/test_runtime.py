@@ -0,0 +1,22 @@
+from tabletop.utils import runtime
+
+
+def test_reset_runtime_cache_rereads_environment(monkeypatch):
+    monkeypatch.delenv("LOW_LATENCY_DISABLED", raising=False)
+    monkeypatch.delenv("LOW_LATENCY_OFF", raising=False)
+    monkeypatch.setenv("PERF_LOGGING", "1")
+    runtime.reset_runtime_cache()
+    try:
+        assert runtime.is_low_latency_disabled() is False
+        assert runtime.is_perf_logging_enabled() is True
+
+        monkeypatch.setenv("LOW_LATENCY_DISABLED", "1")
+        # cached until reset
+        assert runtime.is_low_latency_disabled() is False
+
+        runtime.reset_runtime_cache()
+        assert runtime.is_low_latency_disabled() is True
+        assert runtime.is_perf_logging_enabled() is False
+    finally:
+        monkeypatch.undo()
+        runtime.reset_runtime_cache()